@@ -19,7 +19,7 @@ Ce module implémente un agrégateur complet de vulnérabilités CVE avec :
 * Récupération asynchrone des flux RSS de l'ANSSI
 * Enrichissement via les APIs MITRE et EPSS 
 * Cache mémoire avec TTL (Time To Live)
-* Interface web Flask pour la visualisation
+* Interface web Quart (ASGI) pour la visualisation
 * Build automatisé des assets front-end
 
 :Auteur: Non spécifié
@@ -43,11 +43,17 @@ Bibliothèques standard Python
 * asyncio
     Gestion de l'asynchrone
 * datetime
-    Manipulation des dates/durées via datetime, timedelta
+    Construction des dates de publication via date
 * pathlib
     Manipulation avancée des chemins via Path
+* sqlite3, threading, time
+    Cache L2 persistant sur disque (repli lorsque Redis n'est pas configuré)
 * typing
-    Support du typage statique (List, Dict)
+    Support du typage statique (List, Dict, TYPE_CHECKING)
+* functools
+    Mémoïsation de l'import paresseux de pandas
+* contextlib
+    Contexte neutre lorsque les chaînes Arrow ne sont pas disponibles
 
 Gestion HTTP asynchrone
 ----------------------
@@ -55,62 +61,113 @@ Gestion HTTP asynchrone
     Client HTTP asynchrone complet incluant :
     - ClientTimeout : Configuration des timeouts
     - ClientSession : Gestion des sessions HTTP
+* tenacity
+    Reprise automatique des requêtes (backoff exponentiel avec gigue)
+* aiodns (optionnel)
+    Résolution DNS non bloquante (c-ares) via ``aiohttp.AsyncResolver``
+* brotli (optionnel)
+    Décompression ``br`` des réponses, annoncée automatiquement par aiohttp
+* uvloop (optionnel)
+    Boucle d'événements basée sur libuv, installée si disponible
 
 Analyse de données
 -----------------
 * pandas 
-    Manipulation de données via DataFrame
-* feedparser
-    Parser pour flux RSS/Atom 
+    Manipulation de données via DataFrame (importé à la demande)
+* pyarrow (optionnel)
+    Colonnes texte stockées au format Arrow (``string[pyarrow]``)
+* lxml
+    Parser XML (libxml2) pour les flux RSS
+* orjson
+    Décodage/encodage JSON rapide (réponses MITRE/EPSS, cache L2)
+* cachetools
+    Caches mémoire bornés avec expiration par entrée via TLRUCache
+* redis (optionnel)
+    Cache L2 partagé entre processus, activé par la variable ``REDIS_URL``
+    (à défaut, cache L2 SQLite local)
 
 Framework web
 ------------
-* flask
-    Framework web léger avec :
-    - Flask : Application WSGI
-    - jsonify : Conversion JSON
+* quart
+    Framework web ASGI à l'API compatible Flask avec :
+    - Quart : Application ASGI
+    - Response : Réponse HTTP (JSON pré-sérialisé)
     - render_template : Moteur de templates
 
 Utilitaires
 -----------
 * subprocess
     Exécution de commandes système
+* fcntl (POSIX)
+    Verrou de fichier empêchant deux workers de lancer le build en parallèle
+* hashlib
+    Empreinte BLAKE2b des sources front-end (cache de build)
 * tqdm
     Barres de progression avec versions :
     - tqdm : Synchrone 
-    - tqdm_async, tqdm_asyncio : Asynchrones
+    - tqdm_async : Asynchrone
 """
 
 # --- Bibliothèques standard Python ---
 import os                                # Opérations sur le système de fichiers et variables d'environnement
 import re                                # Expressions régulières pour le traitement de texte
 import asyncio                           # Gestion de l'asynchrone en Python
-from datetime import datetime, timedelta # Manipulation des dates et durées
+from datetime import date                # Construction des dates de publication
 from pathlib import Path                 # Manipulation avancée des chemins de fichiers
-from typing import List, Dict            # Types pour le typage statique
+import sqlite3                           # Cache L2 persistant sur disque
+import threading                         # Verrou d'accès à la connexion SQLite
+import time                              # Horloges (expirations du cache L2, TTL monotone de MemCache)
+from typing import List, Dict, TYPE_CHECKING # Types pour le typage statique
+from functools import lru_cache          # Mémoïsation des imports paresseux
+from contextlib import nullcontext       # Contexte neutre (options pandas indisponibles)
 
 # --- Gestion des requêtes HTTP asynchrones ---
 import aiohttp                           # Client HTTP asynchrone
 from aiohttp import ClientTimeout        # Gestion des timeouts pour les requêtes
 from aiohttp.client import ClientSession # Session cliente HTTP
+from tenacity import (                   # Reprise automatique des requêtes en échec
+    retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
+)
+try:
+    import aiodns # Résolveur DNS c-ares (optionnel)
+except ImportError:
+    aiodns = None
+try:
+    import uvloop # Boucle d'événements libuv (optionnelle)
+    uvloop.install()
+except ImportError:
+    pass
 
 # --- Manipulation et analyse de données ---
-import pandas as pd # Manipulation de données tabulaires avec DataFrame
-import feedparser   # Parser pour les flux RSS
+if TYPE_CHECKING:
+    import pandas as pd  # Importé à la demande via ``_load_pandas``
+from lxml import etree   # Parser XML (libxml2) pour les flux RSS
+import orjson            # Décodage/encodage JSON rapide
+
+# --- Mise en cache ---
+from cachetools import TLRUCache # Cache mémoire borné (LRU) avec expiration par entrée
+try:
+    import redis.asyncio as aioredis # Client Redis asynchrone (cache L2, optionnel)
+except ImportError:
+    aioredis = None
 
 # --- Framework web ---
-from flask import Flask, jsonify, render_template # Framework web léger
-    # - Flask: classe principale;
-    # - jsonify: conversion en JSON;
+from quart import Quart, Response, render_template # Framework web ASGI (API Flask)
+    # - Quart: classe principale;
+    # - Response: réponse HTTP (JSON pré-sérialisé);
     # - render_template: rendu des templates HTML.
 
 # --- Utilitaires système ---
 import subprocess # Exécution de commandes système
+try:
+    import fcntl  # Verrou de fichier inter-processus (POSIX uniquement)
+except ImportError:
+    fcntl = None
+import hashlib    # Empreinte des sources front-end pour le cache de build
 
 # --- Barres de progression ---
 from tqdm import tqdm                       # Barre de progression pour les boucles classiques
 from tqdm.asyncio import tqdm as tqdm_async # Version asynchrone de tqdm
-from tqdm.asyncio import tqdm_asyncio       # Autre version asynchrone de tqdm
 
 # --- Gestion des emails ---
 import smtplib                                 # Bibliothèque standard pour l'envoi d'emails via SMTP 
@@ -121,61 +178,392 @@ from email.mime.multipart import MIMEMultipart # Construction d'emails multi-par
 # CONSTANTES SYSTÈME
 # ====================================
 
-_MAX_THREAD_POOL_SIZE = 500              # Limite maximale de connexions HTTP simultanées
-_IO_TIMEOUT_MS = ClientTimeout(total=10) # Timeout des requêtes HTTP en secondes
-_MEM_CHUNK_SIZE = 100                    # Taille des lots pour le traitement par batch
+_MAX_THREAD_POOL_SIZE = 100              # Limite maximale de connexions HTTP simultanées
+_MAX_HOST_POOL_SIZE = 20                 # Limite de connexions simultanées par hôte
+_KEEPALIVE_TIMEOUT_S = 30                # Durée de maintien des connexions inactives en secondes
+_DNS_CACHE_TTL_S = 10                    # Durée de cache des résolutions DNS (rotation des IP CDN)
+_IO_TIMEOUT_MS = ClientTimeout(total=30) # Timeout des requêtes HTTP en secondes
+_MEM_CHUNK_SIZE = 100                    # Taille initiale des vagues de requêtes MITRE
+_WAVE_MIN_SIZE = 10                      # Taille minimale d'une vague (après ralentissements)
+_WAVE_MAX_SIZE = 400                     # Taille maximale d'une vague
+_WAVE_INCREMENT = 20                     # Croissance additive d'une vague rapide et sans erreur
+_WAVE_TARGET_S = 2.0                     # Durée de vague en dessous de laquelle la taille augmente
+_EPSS_CHUNK_SIZE = 50                    # Nombre de CVEs par requête EPSS (longueur d'URL bornée)
+_EPSS_MAX_INFLIGHT = 4                   # Limite de requêtes EPSS simultanées vers FIRST.org
+_RSS_CHUNK_SIZE = 64 * 1024              # Taille des blocs lus lors du streaming des flux RSS
+_RETRY_MAX_ATTEMPTS = 5                  # Nombre maximal de tentatives par requête HTTP
+_RETRY_MAX_WAIT_S = 10                   # Attente maximale entre deux tentatives en secondes
+
+_EMPTY_DICT: Dict = {}                   # Valeur par défaut partagée (lecture seule)
+
+_RSS_FEED_ADDRS = (                      # Flux RSS de l'ANSSI agrégés par le pipeline
+    "https://www.cert.ssi.gouv.fr/avis/feed",
+    "https://www.cert.ssi.gouv.fr/alerte/feed"
+)
+
+_PAREN_RE = re.compile(r'\(.*?\)')      # Texte entre parenthèses des titres de bulletins
+_CVE_RE = re.compile(r'CVE-\d{4}-\d{4,}')   # Identifiant CVE valide (numéro de séquence de 4 chiffres ou plus)
+_PUBDATE_RE = re.compile(r'\w{3}, (\d{1,2}) (\w{3}) (\d{4}) ') # Jour, mois et année d'une date RFC 822
+_MONTH_MAP = {                           # Abréviations anglaises des mois (RFC 822)
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+_CVSS_SEVERITY_BINS = [0, 4, 7, 9, float('inf')]                # Bornes inférieures des niveaux de menace
+_CVSS_SEVERITY_LABELS = ['Faible', 'Moyenne', 'Élevée', 'Critique'] # Niveaux de menace associés
+
+_OUTPUT_COLUMNS = [                      # Colonnes du jeu de données consolidé, dans l'ordre de sortie
+    "Titre du bulletin (ANSSI)", "Type de bulletin", "Date de publication",
+    "Identifiant CVE", "Score CVSS", "Base Severity", "Type CWE", "Score EPSS",
+    "Lien du bulletin (ANSSI)", "Description", "Éditeur", "Produit", "Versions affectées"
+]
+
+_MITRE_CACHE_TTL_S = 3600                # Durée de vie des métadonnées MITRE en cache (1 heure)
+_EPSS_CACHE_TTL_S = 900                  # Durée de vie des scores EPSS en cache (15 minutes)
+_L1_CACHE_MAX_SIZE = 50_000              # Nombre maximal d'entrées par cache L1 (éviction LRU)
+_FEED_CACHE_TTL_S = 86400                # Durée de vie des validateurs de flux RSS en cache L2 (1 jour)
+
+# Marqueur des CVEs dont la récupération MITRE a échoué (non redemandées par le même moteur)
+_MISS = object()
+
+# Récupérations MITRE en cours, par identifiant CVE (requêtes partagées entre moteurs)
+_MITRE_INFLIGHT_MAP: Dict[str, asyncio.Future] = {}
+
+# Validateurs HTTP (ETag, Last-Modified) et entrées du dernier flux RSS reçu, par URL
+_FEED_META_CACHE: Dict[str, Dict] = {}
+
+_BUILD_BUNDLE_PATH = Path('static/dist/bundle.js')  # Bundle produit par ``npm run build``
+_BUILD_HASH_PATH = Path('.build-cache/hash')        # Empreinte des sources du dernier build réussi
+_BUILD_SRC_DIR = Path('src')                        # Sources front-end
+_BUILD_LOCK_FILE = Path('package-lock.json')        # Dépendances npm figées
+_BUILD_MUTEX_PATH = Path('.build-cache/build.lock') # Verrou partagé entre workers pendant le build
+
+# Session HTTP partagée par l'ensemble des requêtes (créée à la demande)
+_NET_SESSION: ClientSession = None
+_NET_SESSION_LOOP: asyncio.AbstractEventLoop = None
+
+async def _get_net_session() -> ClientSession:
+    """
+    Retourne la session HTTP partagée, en la créant si nécessaire.
+    
+    Une seule ``ClientSession`` adossée à un ``TCPConnector`` est utilisée pour
+    toutes les requêtes (ANSSI, MITRE, EPSS) afin de réutiliser les connexions
+    keep-alive et d'amortir les handshakes TCP/TLS.
+    
+    Retourne
+    --------
+    ClientSession: Session HTTP liée à la boucle d'événements courante
+    
+    Configuration
+    -------------
+        - ``limit``: 100 connexions maximum
+        - ``limit_per_host``: 20 connexions par hôte
+        - ``resolver``: ``AsyncResolver`` (c-ares) si ``aiodns`` est installé
+        - ``Accept-Encoding``: gzip, deflate (+ br/zstd si les décodeurs sont
+          installés), géré par aiohttp qui décompresse les réponses à la volée
+        - ``ttl_dns_cache``: 10 secondes
+        - ``keepalive_timeout``: 30 secondes
+        - ``ssl``: Désactivé
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+    
+        _session_ptr = await _get_net_session()
+        async with _session_ptr.get(url) as _resp_buf:
+            data = await _resp_buf.json()
+    
+    Note
+    ----
+    Une session étant liée à sa boucle d'événements, elle est recréée si la
+    boucle courante a changé (ex: ``asyncio.run`` successifs). Le cache DNS
+    est volontairement court : les API MITRE et FIRST.org sont servies par des
+    CDN, et un cache long épinglerait toutes les connexions sur une seule IP.
+    """
+    global _NET_SESSION, _NET_SESSION_LOOP
+    _loop_ptr = asyncio.get_running_loop()
+    if _NET_SESSION is None or _NET_SESSION.closed or _NET_SESSION_LOOP is not _loop_ptr:
+        _NET_SESSION = ClientSession(
+            timeout=_IO_TIMEOUT_MS,
+            connector=aiohttp.TCPConnector(
+                limit=_MAX_THREAD_POOL_SIZE,
+                limit_per_host=_MAX_HOST_POOL_SIZE,
+                resolver=aiohttp.AsyncResolver() if aiodns else None, # Résolution DNS non bloquante
+                ttl_dns_cache=_DNS_CACHE_TTL_S,         # Cache DNS court (rotation des IP)
+                keepalive_timeout=_KEEPALIVE_TIMEOUT_S, # Réutilisation des connexions
+                ssl=False                               # SSL désactivé
+            ),
+            headers={
+                'User-Agent': 'Mozilla/5.0',
+                'Accept': 'application/json'
+            }
+        )
+        _NET_SESSION_LOOP = _loop_ptr
+    return _NET_SESSION
 
-def _compute_threat_vector(raw_cvss_ptr: str) -> str:
+async def _close_net_session():
     """
-    Convertit un score CVSS en niveau de menace qualitatif.
+    Ferme la session HTTP partagée et libère les connexions du pool.
     
-    Le CVSS est un score numérique de 0 à 10 évaluant la gravité d'une vulnérabilité.
-    Traduit ce score en catégories de risque standardisées.
+    Ferme également le client du cache L2 (Redis ou SQLite) s'il est actif.
+    Doit être appelée avant la fermeture de la boucle d'événements qui
+    porte la session (fin d'``asyncio.run``, arrêt du serveur web).
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+    
+        try:
+            data = await _fetch_all_data()
+        finally:
+            await _close_net_session()
+    """
+    global _NET_SESSION, _NET_SESSION_LOOP
+    if _NET_SESSION is not None and not _NET_SESSION.closed:
+        await _NET_SESSION.close()
+    _NET_SESSION = None
+    _NET_SESSION_LOOP = None
+    if _L2_CACHE:
+        await _L2_CACHE._close()
+
+async def _with_net_session(coro):
+    """
+    Exécute une coroutine puis libère la session HTTP partagée.
+    
+    Point d'entrée des exécutions via ``asyncio.run`` : garantit la fermeture
+    de la session avant celle de la boucle d'événements.
     
     Paramètres
     ----------
-    ``raw_cvss_ptr`` (str): Score CVSS brut à convertir
+    ``coro`` (Coroutine): Coroutine à exécuter
     
     Retourne
     --------
-    str: Niveau de menace ('Faible', 'Moyenne', 'Élevée', 'Critique', ou 'n/a')
+    Any: Résultat de la coroutine
     
-    Mapping des scores
-    ----------------
-        - 0.0 à 3.9  -> Faible   (0x01)
-        - 4.0 à 6.9  -> Moyenne  (0x02)
-        - 7.0 à 8.9  -> Élevée   (0x03)
-        - 9.0 à 10.0 -> Critique (0x04)
-        - Erreur     -> n/a      (0xFF)
-            
     Exemple d'utilisation
     --------------------
     ::
     
-        result = _compute_threat_vector('7.5') # Retourne 'Élevée'
-        result = _compute_threat_vector('9.1') # Retourne 'Critique'
-        result = _compute_threat_vector('err') # Retourne 'n/a'
+        data = asyncio.run(_with_net_session(_fetch_all_data()))
     """
     try:
-        _threat_level_reg = float(raw_cvss_ptr)
-        if _threat_level_reg >= 0 and _threat_level_reg <= 3:
-            # Risque faible (0x01)
-            return "Faible"
-        elif 4 <= _threat_level_reg <= 6:
-            # Risque moyen (0x02)
-            return "Moyenne"
-        elif 7 <= _threat_level_reg <= 8:
-            # Risque élevé (0x03)
-            return "Élevée"
-        elif 9 <= _threat_level_reg <= 10:
-            # Risque critique (0x04)
-            return "Critique"
-        else:
-            # Valeur hors plage (0x00)
-            return "n/a"
-    except (ValueError, TypeError):
-        # Erreur de conversion (0xFF)
-        return "n/a"
+        return await coro
+    finally:
+        await _close_net_session()
+
+@lru_cache(maxsize=None)
+def _load_pandas():
+    """
+    Importe pandas à la demande.
+    
+    Retourne
+    --------
+    module: Module ``pandas`` configuré
+    
+    Note
+    ----
+    L'import de pandas (plusieurs centaines de ms) n'est payé que par les
+    traitements qui construisent un DataFrame. Aucune option globale n'est
+    modifiée (cf. ``_arrow_string_context``).
+    """
+    import pandas as pd
+    return pd
+
+def _arrow_string_context():
+    """
+    Contexte stockant les colonnes texte au format Arrow.
+    
+    Retourne
+    --------
+    ContextManager: ``pd.option_context('future.infer_string', True)`` si
+    ``pyarrow`` est installé et l'option connue (pandas >= 2.1), sinon un
+    contexte neutre
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+
+        with _arrow_string_context():
+            df = pd.DataFrame(columns_buf)
+    
+    Note
+    ----
+    L'option n'est active que pendant la construction du DataFrame : les
+    autres utilisateurs de pandas dans le processus ne sont pas affectés.
+    """
+    pd = _load_pandas()
+    try:
+        import pyarrow # Stockage Arrow des colonnes texte (optionnel)
+        pd.get_option('future.infer_string')
+    except (ImportError, pd.errors.OptionError):
+        return nullcontext()
+    return pd.option_context('future.infer_string', True)
+
+def _compute_threat_vector_batch(raw_cvss_array: 'pd.Series') -> 'pd.Series':
+    """
+    Convertit une colonne de scores CVSS en niveaux de menace qualitatifs.
+    
+    Convertit toute une colonne de scores CVSS en niveaux de menace avec des
+    opérations NumPy sur un tableau ``float32`` (``np.searchsorted`` puis une
+    indexation des libellés), au lieu d'un appel Python par CVE.
+    
+    Paramètres
+    ----------
+    ``raw_cvss_array`` (pd.Series): Scores CVSS bruts (nombres, chaînes ou 'n/a')
+    
+    Retourne
+    --------
+    pd.Series: Niveaux de menace ('Faible', 'Moyenne', 'Élevée', 'Critique', ou 'n/a')
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+    
+        df['Base Severity'] = _compute_threat_vector_batch(df['Score CVSS'])
+        # ['7.5', 9.1, 'n/a'] -> ['Élevée', 'Critique', 'n/a']
+    
+    Note
+    ----
+    Mapping (``_CVSS_SEVERITY_BINS`` / ``_CVSS_SEVERITY_LABELS``) :
+    [0, 4) Faible, [4, 7) Moyenne, [7, 9) Élevée, [9, 10] Critique ; les
+    valeurs non numériques ou hors de l'intervalle [0, 10] donnent 'n/a'.
+    """
+    import numpy as np
+    pd = _load_pandas()
+    _score_buf = pd.to_numeric(raw_cvss_array, errors='coerce').to_numpy(dtype=np.float32, na_value=np.nan)
+    _level_idx = np.searchsorted(_CVSS_SEVERITY_BINS, _score_buf, side='right') - 1
+    _valid_mask = (_score_buf >= 0) & (_score_buf <= 10) # NaN et valeurs hors plage (0x00)
+    _label_array = np.array(_CVSS_SEVERITY_LABELS + ["n/a"], dtype=object)
+    return pd.Series(
+        _label_array[np.where(_valid_mask, _level_idx, len(_CVSS_SEVERITY_LABELS))],
+        index=raw_cvss_array.index,
+        dtype=object
+    )
+
+def _decode_rss_item(item_ptr) -> Dict:
+    """
+    Normalise un élément ``<item>`` d'un flux RSS de l'ANSSI.
+    
+    Paramètres
+    ----------
+    ``item_ptr`` (etree._Element): Élément ``<item>`` complètement analysé
+    
+    Retourne
+    --------
+    Dict: Entrée RSS normalisée contenant:
+        - title: Titre nettoyé (parenthèses retirées)
+        - link: URL du bulletin
+        - type: "Alerte" ou "Avis" selon l'URL
+        - date: Date de publication (format ISO)
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+    
+        for _, item_ptr in pull_parser.read_events():
+            entries.append(_decode_rss_item(item_ptr))
+    
+    Exceptions
+    ----------
+    ``ValueError``: Si ``pubDate`` n'est pas une date RFC 822 valide
+    
+    Note
+    ----
+    Seuls les champs ``title``, ``link`` et ``pubDate`` sont lus. La date est
+    extraite par expression régulière précompilée (``_PUBDATE_RE``) plutôt
+    qu'avec ``datetime.strptime`` : seul le jour est conservé, le fuseau
+    horaire n'a donc pas besoin d'être interprété.
+    """
+    _link_ptr = item_ptr.findtext('link', '')
+    _date_match = _PUBDATE_RE.match(item_ptr.findtext('pubDate', ''))
+    if _date_match is None or _date_match[2] not in _MONTH_MAP:
+        raise ValueError(f"Invalid pubDate: {item_ptr.findtext('pubDate', '')!r}")
+    return {
+        'title': _PAREN_RE.sub('', item_ptr.findtext('title', '')), # Retire les parenthèses du titre
+        'link': _link_ptr,
+        'type': "Alerte" if "alerte" in _link_ptr.lower() else "Avis",
+        'date': date(int(_date_match[3]), _MONTH_MAP[_date_match[2]], int(_date_match[1])).isoformat()
+    }
+
+def _safe_first(block_ptr: Dict, key: str) -> Dict:
+    """
+    Retourne le premier élément de la liste ``block_ptr[key]``.
+    
+    Paramètres
+    ----------
+    ``block_ptr`` (Dict): Bloc JSON MITRE
+    ``key`` (str): Clé d'une liste d'objets (ex: 'metrics', 'affected')
+    
+    Retourne
+    --------
+    Dict: Premier objet de la liste, ou ``_EMPTY_DICT`` si la clé est absente
+    ou la liste vide
+    
+    Note
+    ----
+    Remplace le motif ``.get(key, [{}])[0]``, qui alloue une liste et un dict
+    à chaque appel et échoue sur une liste vide.
+    """
+    _list_ptr = block_ptr.get(key)
+    return _list_ptr[0] if _list_ptr else _EMPTY_DICT
+
+def _drain_rss_items(pull_parser) -> List[Dict]:
+    """
+    Normalise les ``<item>`` terminés d'un parser incrémental et les libère.
+    
+    Paramètres
+    ----------
+    ``pull_parser`` (etree.XMLPullParser): Parser alimenté par blocs
+    
+    Retourne
+    --------
+    List[Dict]: Entrées normalisées par ``_decode_rss_item``
+    
+    Note
+    ----
+    Chaque ``<item>`` est vidé (``clear``) et détaché de ``<channel>`` une fois
+    normalisé : l'arbre reste de taille constante quel que soit le flux.
+    Un élément invalide (``pubDate`` absente ou mal formée) est loggé et
+    ignoré sans interrompre la lecture du reste du flux.
+    """
+    _entry_buf = []
+    for _, _item_ptr in pull_parser.read_events():
+        try:
+            _entry_buf.append(_decode_rss_item(_item_ptr))
+        except ValueError as _err_ptr:
+            print(f"RSS_ERROR: {_err_ptr}")
+        _item_ptr.clear()
+        while _item_ptr.getprevious() is not None:
+            del _item_ptr.getparent()[0]
+    return _entry_buf
+
+_RETRY_BACKOFF_WAIT = wait_exponential_jitter(multiplier=0.5, max=_RETRY_MAX_WAIT_S) # 0.5s, 1s, 2s... + gigue
+
+def _compute_retry_wait(retry_state) -> float:
+    """
+    Calcule l'attente avant la prochaine tentative d'une requête HTTP.
+    
+    Paramètres
+    ----------
+    ``retry_state`` (tenacity.RetryCallState): État de la tentative échouée
+    
+    Retourne
+    --------
+    float: Délai en secondes
+        - ``Retry-After`` du serveur (429/5xx), plafonné à ``_RETRY_MAX_WAIT_S``
+        - Sinon backoff exponentiel avec gigue (``_RETRY_BACKOFF_WAIT``)
+    
+    Note
+    ----
+    Le délai imposé par le serveur remplace le backoff au lieu de s'y ajouter.
+    """
+    _err_ptr = retry_state.outcome.exception()
+    if isinstance(_err_ptr, aiohttp.ClientResponseError) and _err_ptr.headers:
+        _retry_delay = _err_ptr.headers.get('Retry-After', '')
+        if _retry_delay.isdigit():
+            return min(float(_retry_delay), _RETRY_MAX_WAIT_S)
+    return _RETRY_BACKOFF_WAIT(retry_state)
 
 class CVE_DataProcessor_Engine:
     """
@@ -186,19 +574,23 @@ class CVE_DataProcessor_Engine:
     
     Attributs
     ---------
-        ``_net_io_handler`` (ClientSession): Gestionnaire de sessions HTTP asynchrones
-        ``_thread_mutex`` (asyncio.Semaphore): Sémaphore limitant les connexions simultanées
-        ``_l1_mitre_cache`` (dict): Cache niveau 1 pour données MITRE
-        ``_l1_epss_cache`` (dict): Cache niveau 1 pour scores EPSS
-        ``_net_sock`` (aiohttp.TCPConnector): Connecteur TCP avec cache DNS
+        ``_net_io_handler`` (ClientSession): Session HTTP partagée (cf. ``_get_net_session``)
+        ``_l1_mitre_cache`` (L1Cache): Cache niveau 1 pour données MITRE
+        ``_l1_epss_cache`` (L1Cache): Cache niveau 1 pour scores EPSS
+        ``_feed_meta_cache`` (Dict): Validateurs HTTP et entrées des flux RSS
+        ``_l2_cache`` (RedisCache | SQLiteCache): Cache niveau 2 (None si désactivé)
+        ``_mitre_miss_buf`` (Dict): Échecs MITRE de l'exécution (valeur ``_MISS``)
         
     Architecture technique
     ----------------------
     Le moteur implémente plusieurs optimisations:
-        - Cache DNS avec TTL de 5 minutes 
-        - Pooling de connexions HTTP limité à 500 connexions
-        - Traitement par lots des CVEs (100 par batch)
-        - Cache L1 pour les données MITRE et EPSS
+        - Résolution DNS asynchrone (c-ares) avec cache court de 10 secondes
+        - Session HTTP unique avec connexions keep-alive réutilisées
+        - Pooling de connexions HTTP limité à 100 connexions (20 par hôte)
+        - Traitement par vagues de CVEs de taille adaptative (AIMD, 100 au départ)
+        - Cache L1 borné avec TTL pour les données MITRE et EPSS
+        - Requêtes conditionnelles (ETag/Last-Modified) sur les flux RSS
+        - Cache L2 persistant (Redis partagé entre processus, sinon SQLite local)
         - Timeouts configurables pour les requêtes HTTP
         
     Pipeline de traitement
@@ -242,8 +634,8 @@ class CVE_DataProcessor_Engine:
     Voir aussi
     ----------
         - ``MemCache``: Système de cache avec TTL
-        - ``aiohttp.ClientSession``: Gestion des sessions HTTP
-        - ``asyncio.Semaphore``: Limitation des connexions
+        - ``_get_net_session``: Session HTTP partagée
+        - ``aiohttp.TCPConnector``: Limitation des connexions (globale et par hôte)
     """
 
     def __init__(self):
@@ -256,19 +648,29 @@ class CVE_DataProcessor_Engine:
         Attributs initialisés
         --------------------
         ``_net_io_handler`` : None
-            Gestionnaire de sessions HTTP, initialisé lors du context enter
+            Session HTTP partagée, rattachée lors du context enter
 
-        ``_thread_mutex`` : asyncio.Semaphore
-            Sémaphore limitant à 500 connexions simultanées
+        ``_l1_mitre_cache`` : L1Cache
+            Cache partagé des métadonnées MITRE (``_MITRE_L1_CACHE``)
         
-        ``_l1_mitre_cache`` : dict
-            Cache vide pour les métadonnées MITRE
+        ``_l1_epss_cache`` : L1Cache
+            Cache partagé des scores EPSS (``_EPSS_L1_CACHE``)
         
-        ``_l1_epss_cache`` : dict
-            Cache vide pour les scores EPSS
+        ``_feed_meta_cache`` : Dict
+            Validateurs HTTP et entrées des flux RSS (``_FEED_META_CACHE``)
         
-        ``_net_sock`` : None
-            Socket réseau, initialisé lors du context enter
+        ``_l2_cache`` : RedisCache | SQLiteCache
+            Cache L2 (``_L2_CACHE``, Redis ou SQLite), None si désactivé
+        
+        ``_mitre_miss_buf`` : Dict
+            CVEs dont la récupération MITRE a échoué, marquées ``_MISS``
+            (propre au moteur : un échec n'est pas réessayé pendant l'exécution)
+        
+        ``_wave_size`` : int
+            Taille courante des vagues de requêtes MITRE (``_MEM_CHUNK_SIZE``)
+        
+        ``_throttle_count`` : int
+            Nombre de réponses 429/5xx et de timeouts observés
 
         Exemple d'utilisation
         --------------------
@@ -287,33 +689,31 @@ class CVE_DataProcessor_Engine:
         """
         # Initialisation des registres système
         self._net_io_handler: ClientSession = None
-        self._thread_mutex = asyncio.Semaphore(_MAX_THREAD_POOL_SIZE)
-        self._l1_mitre_cache = {} # Cache des métadonnées MITRE
-        self._l1_epss_cache = {}  # Cache des scores EPSS
-        self._net_sock = None     # Socket réseau réutilisable
+        self._l1_mitre_cache = _MITRE_L1_CACHE # Cache des métadonnées MITRE
+        self._l1_epss_cache = _EPSS_L1_CACHE   # Cache des scores EPSS
+        self._feed_meta_cache = _FEED_META_CACHE # Validateurs des flux RSS
+        self._l2_cache = _L2_CACHE             # Cache L2 Redis ou SQLite (optionnel)
+        self._mitre_miss_buf = {}              # Échecs MITRE de l'exécution (``_MISS``)
+        self._wave_size = _MEM_CHUNK_SIZE      # Taille adaptative des vagues MITRE
+        self._throttle_count = 0               # Signaux de surcharge des API distantes
 
     async def __aenter__(self):
         """
-        Initialise la session HTTP asynchrone et les ressources réseau.
+        Rattache le moteur à la session HTTP partagée.
         
-        Configure et établit une session HTTP optimisée pour les performances
-        avec gestion du cache DNS et du pooling de connexions.
+        Récupère (ou crée à la première utilisation) la session HTTP unique
+        du module afin que tous les moteurs réutilisent le même pool de
+        connexions keep-alive et le même cache DNS.
         
         Configuration
         ------------
-        Session HTTP :
-            - Cache DNS activé avec TTL de 5 minutes
-            - Pool de connexions limité à 500
+        Session HTTP (cf. ``_get_net_session``) :
+            - Résolution DNS asynchrone, cache DNS de 10 secondes
+            - Pool de connexions limité à 100 (20 par hôte)
+            - Connexions keep-alive conservées 30 secondes
             - SSL désactivé pour les performances
             - Headers HTTP standards
         
-        Connecteur TCP
-        -------------
-            - ``limit``: 500 connexions maximum
-            - ``ttl_dns_cache``: 300 secondes
-            - ``use_dns_cache``: Activé
-            - ``ssl``: Désactivé
-        
         Headers HTTP
         -----------
         ::
@@ -328,8 +728,7 @@ class CVE_DataProcessor_Engine:
         ::
 
             async with CVE_DataProcessor_Engine() as engine:
-                # La session HTTP est maintenant initialisée
-                # avec la configuration optimale
+                # La session HTTP partagée est maintenant disponible
                 await engine._process_cve_batch(entries)
         
         Retourne
@@ -340,29 +739,15 @@ class CVE_DataProcessor_Engine:
         ----
         Le SSL est désactivé pour les performances. À adapter en production.
         """
-        if not self._net_sock:
-            self._net_sock = aiohttp.TCPConnector(
-                limit=_MAX_THREAD_POOL_SIZE, 
-                ttl_dns_cache=300,  # Cache DNS de 5 minutes
-                use_dns_cache=True, # Activation du cache DNS
-                ssl=False           # SSL désactivé
-            )
-        self._net_io_handler = ClientSession(
-            timeout=_IO_TIMEOUT_MS,
-            connector=self._net_sock,
-            headers={
-                'User-Agent': 'Mozilla/5.0',
-                'Accept': 'application/json'
-            }
-        )
+        self._net_io_handler = await _get_net_session()
         return self
 
     async def __aexit__(self, _exc_type, _exc_val, _exc_tb):
         """
-        Nettoie les ressources réseau à la sortie du context manager.
+        Détache le moteur de la session HTTP partagée.
         
-        Assure la fermeture propre de la session HTTP et la libération
-        des ressources réseau pour éviter les fuites mémoire.
+        La session n'est pas fermée ici : elle reste disponible pour les
+        moteurs suivants et est libérée par ``_close_net_session``.
         
         Paramètres
         ----------
@@ -370,36 +755,29 @@ class CVE_DataProcessor_Engine:
         ``_exc_val`` (BaseException): Instance de l'exception si elle existe
         ``_exc_tb`` (TracebackType): Traceback de l'exception si elle existe
         
-        Actions réalisées
-        ----------------
-        - Fermeture de la session HTTP si elle existe
-        - Libération des connexions du pool
-        - Nettoyage du cache DNS
-        
         Exemple d'utilisation
         --------------------
         ::
 
             async with CVE_DataProcessor_Engine() as engine:
-                # Le context manager gère automatiquement les ressources
                 await engine._process_cve_batch(entries)
-            # À la sortie du bloc, __aexit__ est appelé automatiquement
-            # pour nettoyer les ressources
+            # À la sortie du bloc, la session reste ouverte pour
+            # être réutilisée par le moteur suivant
         
         Note
         ----
         Les paramètres d'exception ne sont pas utilisés car toutes les 
         exceptions sont propagées au code appelant.
         """
-        if self._net_io_handler:
-            await self._net_io_handler.close()
+        self._net_io_handler = None
 
-    def _decode_rss_stream(self, feed_addr: str) -> List[Dict]:
+    async def _decode_rss_stream(self, feed_addr: str) -> List[Dict]:
         """
-        Décode et analyse un flux RSS pour en extraire les CVEs.
+        Télécharge et analyse un flux RSS pour en extraire les CVEs.
         
-        Parse un flux RSS de l'ANSSI et extrait les informations pertinentes
-        en nettoyant et standardisant les données.
+        Récupère un flux RSS de l'ANSSI via la session HTTP partagée et
+        l'analyse au fil de la réception : le corps n'est jamais matérialisé
+        en entier et le parsing commence avant l'arrivée du dernier octet.
 
         Paramètres
         ----------
@@ -415,10 +793,15 @@ class CVE_DataProcessor_Engine:
 
         Traitement effectué
         ------------------
-        1. Parse du flux RSS avec feedparser
-        2. Nettoyage des titres (retrait des parenthèses)
-        3. Détection du type selon l'URL
-        4. Standardisation des dates au format ISO
+        0. Requête conditionnelle (``If-None-Match``/``If-Modified-Since``) :
+           sur ``304 Not Modified``, les entrées du dernier flux sont réutilisées
+        1. Téléchargement du flux par blocs de 64 Ko (session HTTP partagée)
+        2. Parse XML incrémental avec ``lxml.etree.XMLPullParser``
+        3. Normalisation puis libération de chaque ``<item>`` terminé
+           (``_drain_rss_items``), mémoire constante quelle que soit la taille
+        4. Nettoyage des titres (retrait des parenthèses)
+        5. Détection du type selon l'URL
+        6. Standardisation des dates au format ISO
         
         Format de sortie
         ---------------
@@ -439,34 +822,137 @@ class CVE_DataProcessor_Engine:
         ::
 
             feed_url = "https://www.cert.ssi.gouv.fr/alerte/feed"
-            engine = CVE_DataProcessor_Engine()
-            entries = engine._decode_rss_stream(feed_url)
+            async with CVE_DataProcessor_Engine() as engine:
+                entries = await engine._decode_rss_stream(feed_url)
             for entry in entries:
                 print(f"Title: {entry['title']}, Type: {entry['type']}")
 
         Note
         ----
+        Retourne une liste vide si le flux est indisponible ou invalide.
         Le type est déterminé automatiquement selon la présence du mot "alerte"
-        dans l'URL du bulletin.
+        dans l'URL du bulletin. Les validateurs et entrées du flux sont aussi
+        conservés dans le cache L2 (clé ``feed:<url>``) lorsqu'il est actif.
         """
-        _raw_feed_buf = feedparser.parse(feed_addr)
-        return [{
-            'title': re.sub(r'\(.*?\)', '', _entry_ptr.title), # Retire les parenthèses du titre
-            'link': _entry_ptr.link,
-            'type': "Alerte" if "alerte" in _entry_ptr.link.lower() else "Avis",
-            'date': datetime.strptime(_entry_ptr.published, '%a, %d %b %Y %H:%M:%S %z').date().isoformat()
-        } for _entry_ptr in _raw_feed_buf.entries]
+        _feed_meta = self._feed_meta_cache.get(feed_addr)
+        if _feed_meta is None and self._l2_cache:
+            _feed_meta = (await self._l2_cache._get_many('feed', [feed_addr])).get(feed_addr)
+        
+        _req_headers = {}
+        if _feed_meta:
+            if _feed_meta.get('etag'):
+                _req_headers['If-None-Match'] = _feed_meta['etag']
+            if _feed_meta.get('last_modified'):
+                _req_headers['If-Modified-Since'] = _feed_meta['last_modified']
+        
+        _pull_parser = etree.XMLPullParser(events=('end',), tag='item')
+        _entry_buf = []
+        try:
+            async with self._net_io_handler.get(feed_addr, headers=_req_headers) as _resp_buf:
+                if _resp_buf.status == 304 and _feed_meta:
+                    self._feed_meta_cache[feed_addr] = _feed_meta
+                    return list(_feed_meta['entries'])
+                if _resp_buf.status != 200:
+                    return []
+                _etag_ptr = _resp_buf.headers.get('ETag')
+                _last_modified_ptr = _resp_buf.headers.get('Last-Modified')
+                # Parsing incrémental : chaque bloc reçu est analysé immédiatement
+                async for _chunk_ptr in _resp_buf.content.iter_chunked(_RSS_CHUNK_SIZE):
+                    _pull_parser.feed(_chunk_ptr)
+                    _entry_buf.extend(_drain_rss_items(_pull_parser))
+            _pull_parser.close()
+            _entry_buf.extend(_drain_rss_items(_pull_parser))
+        except (aiohttp.ClientError, asyncio.TimeoutError, etree.XMLSyntaxError) as _err_ptr:
+            print(f"RSS_ERROR: {_err_ptr}")
+            return []
+        
+        # Mémorisation des validateurs pour la prochaine requête conditionnelle
+        if _etag_ptr or _last_modified_ptr:
+            _feed_meta = {
+                'etag': _etag_ptr,
+                'last_modified': _last_modified_ptr,
+                'entries': _entry_buf
+            }
+            self._feed_meta_cache[feed_addr] = _feed_meta
+            if self._l2_cache:
+                await self._l2_cache._set_many('feed', {feed_addr: _feed_meta}, _FEED_CACHE_TTL_S)
+        return list(_entry_buf)
+
+    @retry(
+        stop=stop_after_attempt(_RETRY_MAX_ATTEMPTS),
+        wait=_compute_retry_wait,
+        retry=retry_if_exception_type((aiohttp.ClientError, asyncio.TimeoutError)),
+        reraise=True
+    )
+    async def _request_remote_data(self, target_addr: str, params: Dict = None) -> Dict:
+        """
+        Exécute une requête HTTP GET avec reprise automatique sur erreur transitoire.
+        
+        Les erreurs réseau, les timeouts et les réponses 429/5xx déclenchent une
+        nouvelle tentative avec backoff exponentiel et gigue (jusqu'à 5 essais).
+        
+        Paramètres
+        ----------
+        ``target_addr`` (str): URL de l'API à interroger
+        ``params`` (Dict, optional): Paramètres de la query string
+        
+        Retourne
+        --------
+        Dict: Réponse JSON de l'API, ou dictionnaire vide si status != 200
+        
+        Exceptions
+        ----------
+        ``aiohttp.ClientError``, ``asyncio.TimeoutError``: Si toutes les
+        tentatives ont échoué
+        
+        Politique de reprise
+        -------------------
+        - Attente exponentielle de 0.5s à 10s avec gigue aléatoire
+        - Sur 429/5xx, l'en-tête ``Retry-After`` remplace cette attente
+          (plafonné à 10s, cf. ``_compute_retry_wait``)
+        - Les autres statuts (ex: 404) ne sont pas réessayés
+        
+        Exemple d'utilisation
+        --------------------
+        ::
 
-    async def _fetch_remote_data(self, target_addr: str) -> Dict:
+            data = await engine._request_remote_data(
+                "https://api.first.org/data/v1/epss",
+                params={"cve[]": ['CVE-2024-1234']}
+            )
+        """
+        try:
+            async with self._net_io_handler.get(target_addr, params=params) as _resp_buf:
+                if _resp_buf.status == 200:
+                    return orjson.loads(await _resp_buf.read())
+                if _resp_buf.status != 429 and _resp_buf.status < 500:
+                    return {}
+                _status_err = aiohttp.ClientResponseError(
+                    _resp_buf.request_info,
+                    _resp_buf.history,
+                    status=_resp_buf.status,
+                    message=_resp_buf.reason or '',
+                    headers=_resp_buf.headers
+                )
+        except asyncio.TimeoutError:
+            self._throttle_count += 1 # Signal de surcharge (cf. ``_adapt_wave_size``)
+            raise
+        self._throttle_count += 1
+        # Le délai ``Retry-After`` est appliqué par tenacity (``_compute_retry_wait``)
+        raise _status_err
+
+    async def _fetch_remote_data(self, target_addr: str, params: Dict = None) -> Dict:
         """
         Récupère des données depuis une API distante de manière asynchrone.
         
-        Effectue une requête HTTP GET avec gestion des erreurs et des timeouts.
-        Utilise un sémaphore pour limiter le nombre de connexions simultanées.
+        Effectue une requête HTTP GET avec gestion des erreurs, des timeouts et
+        reprise automatique (cf. ``_request_remote_data``).
+        Le nombre de connexions simultanées est borné par le connecteur.
         
         Paramètres
         ----------
         ``target_addr`` (str): URL de l'API à interroger
+        ``params`` (Dict, optional): Paramètres de la query string
         
         Retourne
         --------
@@ -474,10 +960,11 @@ class CVE_DataProcessor_Engine:
         
         Gestion des erreurs
         ------------------
-        - Timeout de connexion : retourne {}
-        - Erreur HTTP : retourne {} si status != 200
+        - Timeout de connexion : 5 tentatives, puis retourne {}
+        - Erreur HTTP 429/5xx : 5 tentatives, puis retourne {}
+        - Autre erreur HTTP : retourne {} si status != 200
         - Erreur JSON : retourne {}
-        - Autres erreurs : retourne {}
+        - Annulation et erreurs de programmation : propagées
         
         Exemple d'utilisation
         --------------------
@@ -490,14 +977,15 @@ class CVE_DataProcessor_Engine:
         
         Note
         ----
-        Utilise le sémaphore ``_thread_mutex`` pour limiter à 500 connexions simultanées.
+        Le ``TCPConnector`` partagé limite les requêtes en vol (100 au total,
+        20 par hôte) sans sémaphore Python supplémentaire. Une réponse vide
+        n'est jamais mise en cache par les appelants : la CVE sera redemandée
+        au prochain passage.
         """
-        async with self._thread_mutex:
-            try:
-                async with self._net_io_handler.get(target_addr) as _resp_buf:
-                    return await _resp_buf.json() if _resp_buf.status == 200 else {}
-            except:
-                return {}
+        try:
+            return await self._request_remote_data(target_addr, params)
+        except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError):
+            return {}
 
     async def _process_cve_batch(self, feed_entries: List[Dict]) -> List[Dict]:
         """
@@ -534,6 +1022,7 @@ class CVE_DataProcessor_Engine:
         --------------------
         - Vérification de la présence des données JSON
         - Validation des champs 'cves' et 'name'
+        - Rejet des identifiants mal formés (``_CVE_RE``), avant tout appel MITRE/EPSS
         - Nettoyage des données manquantes
         
         Exemple d'utilisation
@@ -557,28 +1046,21 @@ class CVE_DataProcessor_Engine:
         Note
         ----
         Utilise ``asyncio.gather`` pour le traitement parallèle optimal.
+        Les entrées RSS doivent provenir de ``_decode_rss_item`` : tous leurs
+        champs sont recopiés dans chaque CVE extraite.
         """
         # Création des tâches asynchrones pour chaque entrée
         _task_queue = [self._fetch_remote_data(f"{_entry_ptr['link']}json") 
                       for _entry_ptr in feed_entries]
         _result_buf = await asyncio.gather(*_task_queue)
         
-        _cve_buf = []
-        for _entry_ptr, _data_block in zip(feed_entries, _result_buf):
-            # Validation des données et extraction des CVEs
-            if not _data_block or 'cves' not in _data_block:
-                continue
-            for _cve_block in _data_block['cves']:
-                if 'name' not in _cve_block:
-                    continue
-                _cve_buf.append({
-                    'cve_id': _cve_block['name'],
-                    'title': _entry_ptr['title'],
-                    'type': _entry_ptr['type'],
-                    'date': _entry_ptr['date'],
-                    'link': _entry_ptr['link']
-                })
-        return _cve_buf
+        # Validation des données et extraction des CVEs en une seule compréhension
+        # (les métadonnées du bulletin sont copiées d'un bloc depuis l'entrée RSS)
+        return [{'cve_id': _cve_block['name'], **_entry_ptr}
+                for _entry_ptr, _data_block in zip(feed_entries, _result_buf)
+                if _data_block and 'cves' in _data_block
+                for _cve_block in _data_block['cves']
+                if _CVE_RE.fullmatch(_cve_block.get('name') or '')]
 
     async def _fetch_mitre_metadata(self, cve_id_array: List[str]) -> Dict:
         """
@@ -603,11 +1085,14 @@ class CVE_DataProcessor_Engine:
         
         Pipeline de traitement
         --------------------
-        1. Vérification des données en cache L1
-        2. Identification des CVEs manquantes
-        3. Récupération par lots des données manquantes
-        4. Mise à jour du cache avec les nouvelles données
-        5. Fusion des données (cache + nouvelles)
+        1. Vérification des données en cache L1 (identifiants dédoublonnés)
+        2. Vérification du cache L2 (Redis ou SQLite, si actif)
+        3. Récupération des données manquantes par vagues (100 CVEs au départ,
+           taille ajustée par ``_adapt_wave_size``), en réutilisant
+           les requêtes déjà en cours pour les mêmes CVEs (``_MITRE_INFLIGHT_MAP``)
+        4. Mise à jour du cache L1 à chaque réponse (``asyncio.as_completed``),
+           du cache L2 à la fin de chaque lot
+        5. Attente des requêtes partagées puis fusion des données (cache + nouvelles)
         
         Format de retour
         ---------------
@@ -637,32 +1122,138 @@ class CVE_DataProcessor_Engine:
         
         Note
         ----
-        Le cache L1 est persistant pendant toute la durée de vie de l'instance.
-        """
-        # Identification des CVEs non présentes en cache
-        _uncached_cve_ptrs = [_cve_id for _cve_id in cve_id_array 
-                             if _cve_id not in self._l1_mitre_cache]
-        
-        if _uncached_cve_ptrs:
-            _task_buf = []
-            # Traitement par lots pour éviter la surcharge
-            for i in range(0, len(_uncached_cve_ptrs), _MEM_CHUNK_SIZE):
-                _chunk_ptr = _uncached_cve_ptrs[i:i + _MEM_CHUNK_SIZE]
-                _task_buf.extend([self._fetch_remote_data(
-                    f"https://cveawg.mitre.org/api/cve/{_cve_id}"
-                ) for _cve_id in _chunk_ptr])
-            
-            _result_buf = await asyncio.gather(*_task_buf)
+        Le cache L1 est partagé entre les moteurs et expire après 1 heure
+        (ou à l'expiration de la copie L2 dont l'entrée provient).
+        Une CVE déjà en cours de récupération (autre moteur, autre lot ou
+        doublon) n'est jamais demandée deux fois à l'API MITRE. Une CVE dont
+        la récupération a échoué est marquée ``_MISS`` dans le registre du
+        moteur et n'est pas redemandée avant l'exécution suivante (une erreur
+        transitoire n'est donc pas mémorisée au-delà du moteur courant).
+        """
+        # Identification des CVEs non présentes en cache (une seule fois chacune)
+        _uncached_cve_ptrs = [_cve_id for _cve_id in dict.fromkeys(cve_id_array) 
+                             if _cve_id not in self._l1_mitre_cache
+                             and self._mitre_miss_buf.get(_cve_id) is not _MISS]
+        
+        _mitre_block_buf = {}
+        if _uncached_cve_ptrs and self._l2_cache:
+            # Consultation du cache L2 avant tout appel réseau
+            _l2_hit_buf = await self._l2_cache._get_many('mitre', _uncached_cve_ptrs, with_ttl=True)
+            self._l1_mitre_cache._promote(_l2_hit_buf)
+            _mitre_block_buf = {_cve_id: _hit_ptr[0] for _cve_id, _hit_ptr in _l2_hit_buf.items()}
+            _uncached_cve_ptrs = [_cve_id for _cve_id in _uncached_cve_ptrs 
+                                 if _cve_id not in _mitre_block_buf]
+        
+        # Traitement par vagues : chaque vague est récupérée puis mise en cache
+        # avant la suivante (l'API MITRE n'offre pas de recherche groupée) ;
+        # la taille des vagues s'adapte à la réponse du serveur
+        _loop_ptr = asyncio.get_running_loop()
+        _pending_fut_map = {}
+        _cursor_idx = 0
+        while _cursor_idx < len(_uncached_cve_ptrs):
+            _wave_ptrs = _uncached_cve_ptrs[_cursor_idx:_cursor_idx + self._wave_size]
+            _cursor_idx += len(_wave_ptrs)
+            # Single-flight : seules les CVEs sans requête en cours sont demandées
+            _chunk_ptr = []
+            for _cve_id in _wave_ptrs:
+                if _cve_id in self._l1_mitre_cache:
+                    continue # CVE mise en cache entre-temps par un autre appel
+                _inflight_fut = _MITRE_INFLIGHT_MAP.get(_cve_id)
+                if _inflight_fut is not None and _inflight_fut.get_loop() is _loop_ptr:
+                    _pending_fut_map[_cve_id] = _inflight_fut
+                else:
+                    _MITRE_INFLIGHT_MAP[_cve_id] = _loop_ptr.create_future()
+                    _chunk_ptr.append(_cve_id)
             
-            # Mise à jour du cache avec les nouvelles données
-            for _cve_id, _data_block in zip(_uncached_cve_ptrs, _result_buf):
-                if _data_block and 'containers' in _data_block:
-                    self._l1_mitre_cache[_cve_id] = self._process_mitre_block(_data_block)
-        
-        # Retourne toutes les données (cache + nouvelles)
-        return {_cve_id: self._l1_mitre_cache.get(_cve_id, {}) 
+            if not _chunk_ptr:
+                continue
+            _chunk_block_buf = {}
+            _wave_start_ts = time.monotonic()
+            _throttle_mark = self._throttle_count
+            try:
+                # Chaque réponse est traitée et publiée dès son arrivée, sans
+                # attendre la requête la plus lente du lot
+                for _record_task in asyncio.as_completed(
+                    [self._fetch_mitre_record(_cve_id) for _cve_id in _chunk_ptr]
+                ):
+                    _cve_id, _data_block = await _record_task
+                    _block_ptr = None
+                    if _data_block and 'containers' in _data_block:
+                        _block_ptr = self._process_mitre_block(_data_block)
+                        _chunk_block_buf[_cve_id] = _block_ptr
+                        _mitre_block_buf[_cve_id] = _block_ptr
+                        self._l1_mitre_cache[_cve_id] = _block_ptr
+                    else:
+                        self._mitre_miss_buf[_cve_id] = _MISS
+                    _MITRE_INFLIGHT_MAP.pop(_cve_id).set_result(_block_ptr)
+            finally:
+                # Libération des requêtes partagées restantes (échec ou annulation)
+                for _cve_id in _chunk_ptr:
+                    _inflight_fut = _MITRE_INFLIGHT_MAP.get(_cve_id)
+                    if _inflight_fut is not None and not _inflight_fut.done():
+                        _MITRE_INFLIGHT_MAP.pop(_cve_id).set_result(None)
+            self._adapt_wave_size(time.monotonic() - _wave_start_ts, self._throttle_count - _throttle_mark)
+            if self._l2_cache:
+                await self._l2_cache._set_many('mitre', _chunk_block_buf, _MITRE_CACHE_TTL_S)
+        
+        # Résultats des requêtes lancées par d'autres appels pour les mêmes CVEs
+        if _pending_fut_map:
+            _shared_block_array = await asyncio.gather(*_pending_fut_map.values())
+            for _cve_id, _block_ptr in zip(_pending_fut_map, _shared_block_array):
+                if _block_ptr is not None:
+                    _mitre_block_buf[_cve_id] = _block_ptr
+                else:
+                    self._mitre_miss_buf[_cve_id] = _MISS
+        
+        # Retourne toutes les données (nouvelles + cache, une entrée pouvant
+        # avoir été évincée du cache borné entre-temps)
+        return {_cve_id: _mitre_block_buf.get(_cve_id, self._l1_mitre_cache.get(_cve_id, {})) 
                 for _cve_id in cve_id_array}
     
+    def _adapt_wave_size(self, wave_latency_s: float, throttle_events: int):
+        """
+        Ajuste la taille des vagues MITRE selon la dernière vague (AIMD).
+        
+        Paramètres
+        ----------
+        ``wave_latency_s`` (float): Durée de la vague en secondes
+        ``throttle_events`` (int): Réponses 429/5xx et timeouts pendant la vague
+        
+        Règles d'ajustement
+        ------------------
+        - Surcharge détectée : taille divisée par 2 (minimum 10)
+        - Vague rapide (< 2s) sans erreur : taille augmentée de 20 (maximum 400)
+        - Sinon : taille inchangée
+        
+        Note
+        ----
+        La décroissance multiplicative réagit immédiatement au rate limiting
+        de l'API MITRE, la croissance additive le sonde prudemment ensuite.
+        """
+        if throttle_events:
+            self._wave_size = max(_WAVE_MIN_SIZE, self._wave_size // 2)
+        elif wave_latency_s < _WAVE_TARGET_S:
+            self._wave_size = min(_WAVE_MAX_SIZE, self._wave_size + _WAVE_INCREMENT)
+
+    async def _fetch_mitre_record(self, cve_id: str) -> tuple:
+        """
+        Récupère la fiche MITRE brute d'une CVE, étiquetée par son identifiant.
+        
+        Paramètres
+        ----------
+        ``cve_id`` (str): Identifiant CVE
+        
+        Retourne
+        --------
+        tuple: ``(cve_id, data_block)``, ``data_block`` valant {} en cas d'erreur
+        
+        Note
+        ----
+        L'étiquette permet de retrouver la CVE d'une réponse obtenue via
+        ``asyncio.as_completed``, qui ne préserve pas l'ordre des requêtes.
+        """
+        return cve_id, await self._fetch_remote_data(f"https://cveawg.mitre.org/api/cve/{cve_id}")
+    
     def _process_mitre_block(self, data_block: Dict) -> Dict:
         """
         Parse et normalise un bloc de données MITRE.
@@ -717,22 +1308,23 @@ class CVE_DataProcessor_Engine:
         
         Note
         ----
-        Retourne 'n/a' pour les champs non trouvés ou invalides.
+        Retourne 'n/a' pour les champs non trouvés ou invalides (y compris
+        les listes vides, via ``_safe_first``).
         """
         # Extraction des pointeurs vers les différentes sections
-        _cna_ptr = data_block['containers'].get('cna', {})
-        _metrics_ptr = _cna_ptr.get('metrics', [{}])[0].get('cvssV3_1', {})
-        _affected_ptr = _cna_ptr.get('affected', [{}])[0]
-        _problem_ptr = _cna_ptr.get('problemTypes', [{}])[0].get('descriptions', [{}])[0]
+        _cna_ptr = data_block['containers'].get('cna') or _EMPTY_DICT
+        _metrics_ptr = _safe_first(_cna_ptr, 'metrics').get('cvssV3_1') or _EMPTY_DICT
+        _affected_ptr = _safe_first(_cna_ptr, 'affected')
+        _problem_ptr = _safe_first(_safe_first(_cna_ptr, 'problemTypes'), 'descriptions')
         
         return {
             'cvss_score': _metrics_ptr.get('baseScore', 'n/a'),
-            'description': _cna_ptr.get('descriptions', [{}])[0].get('value', 'n/a'),
+            'description': _safe_first(_cna_ptr, 'descriptions').get('value', 'n/a'),
             'cwe_desc': _problem_ptr.get('description', 'n/a'),
             'vendor': _affected_ptr.get('vendor', 'n/a'),
             'product': _affected_ptr.get('product', 'n/a'),
             'versions': ', '.join(v.get('version', '') 
-                        for v in _affected_ptr.get('versions', []))
+                        for v in _affected_ptr.get('versions') or ())
         }
 
     async def _fetch_epss_scores(self, cve_id_array: List[str]) -> Dict:
@@ -754,11 +1346,12 @@ class CVE_DataProcessor_Engine:
         
         Traitement des données
         --------------------
-        1. Vérification du cache L1
-        2. Construction de la requête pour les CVEs manquantes
-        3. Appel à l'API FIRST.org
-        4. Mise à jour du cache avec les nouveaux scores
-        5. Fusion des données (cache + nouvelles)
+        1. Vérification du cache L1 (identifiants dédoublonnés)
+        2. Vérification du cache L2 (Redis ou SQLite, si actif)
+        3. Découpage des CVEs manquantes en lots de 50
+        4. Appels concurrents à l'API FIRST.org (4 requêtes en vol au plus)
+        5. Mise à jour des caches avec les nouveaux scores
+        6. Fusion des données (cache + nouvelles)
         
         Format de retour
         ---------------
@@ -783,74 +1376,123 @@ class CVE_DataProcessor_Engine:
         
         Note
         ----
-        Le cache L1 est persistant durant toute la durée de vie de l'instance.
+        Le cache L1 est partagé entre les moteurs et expire après 15 minutes
+        (ou à l'expiration de la copie L2 dont l'entrée provient).
         Les scores sont normalisés entre 0 (risque minimal) et 1 (risque maximal).
         """
-        # Vérification du cache
-        _uncached_cve_ptrs = [_cve_id for _cve_id in cve_id_array 
+        # Vérification du cache (une seule fois par CVE)
+        _uncached_cve_ptrs = [_cve_id for _cve_id in dict.fromkeys(cve_id_array) 
                              if _cve_id not in self._l1_epss_cache]
         if not _uncached_cve_ptrs:
             return {_cve_id: self._l1_epss_cache.get(_cve_id, 'n/a') 
                     for _cve_id in cve_id_array}
 
         _epss_score_buf = {}
+        if self._l2_cache:
+            # Consultation du cache L2 avant tout appel réseau
+            _l2_hit_buf = await self._l2_cache._get_many('epss', _uncached_cve_ptrs, with_ttl=True)
+            self._l1_epss_cache._promote(_l2_hit_buf)
+            _epss_score_buf = {_cve_id: _hit_ptr[0] for _cve_id, _hit_ptr in _l2_hit_buf.items()}
+            _uncached_cve_ptrs = [_cve_id for _cve_id in _uncached_cve_ptrs 
+                                 if _cve_id not in _epss_score_buf]
+            if not _uncached_cve_ptrs:
+                return {_cve_id: _epss_score_buf.get(_cve_id, self._l1_epss_cache.get(_cve_id, 'n/a')) 
+                        for _cve_id in cve_id_array}
+
+        # Requêtes à l'API EPSS par lots bornés, exécutées en parallèle
+        _epss_mutex = asyncio.Semaphore(_EPSS_MAX_INFLIGHT)
+        _chunk_score_array = await asyncio.gather(*[
+            self._fetch_epss_chunk(_uncached_cve_ptrs[_idx:_idx + _EPSS_CHUNK_SIZE], _epss_mutex)
+            for _idx in range(0, len(_uncached_cve_ptrs), _EPSS_CHUNK_SIZE)
+        ])
+        # Mise à jour du cache avec les nouveaux scores
+        for _chunk_score_buf in _chunk_score_array:
+            self._l1_epss_cache.update(_chunk_score_buf)
+            _epss_score_buf.update(_chunk_score_buf)
+        
+        if self._l2_cache:
+            await self._l2_cache._set_many('epss', {
+                _cve_id: _epss_score_buf[_cve_id] 
+                for _cve_id in _uncached_cve_ptrs if _cve_id in _epss_score_buf
+            }, _EPSS_CACHE_TTL_S)
+        
+        # Retour des données combinées (nouvelles + cache)
+        return {_cve_id: _epss_score_buf.get(_cve_id, self._l1_epss_cache.get(_cve_id, 'n/a')) 
+                for _cve_id in cve_id_array}
+
+    async def _fetch_epss_chunk(self, cve_chunk: List[str], epss_mutex: asyncio.Semaphore) -> Dict:
+        """
+        Récupère les scores EPSS d'un lot de CVEs en une requête.
+        
+        Paramètres
+        ----------
+        ``cve_chunk`` (List[str]): Identifiants CVE du lot (50 au plus)
+        ``epss_mutex`` (asyncio.Semaphore): Limite des requêtes EPSS en vol
+        
+        Retourne
+        --------
+        Dict: Scores EPSS (float) indexés par identifiant CVE
+        
+        Note
+        ----
+        Un lot en échec est loggé et retourne un dictionnaire vide, sans
+        affecter les autres lots.
+        """
+        _chunk_score_buf = {}
         try:
-            # Requête à l'API EPSS avec tous les CVEs non cachés
-            _params_block = {"cve[]": _uncached_cve_ptrs}
-            async with self._net_io_handler.get(
-                "https://api.first.org/data/v1/epss",
-                params=_params_block,
-                ssl=False # SSL désactivé pour les performances
-            ) as _resp_buf:
-                if _resp_buf.status == 200:
-                    _data_block = await _resp_buf.json()
-                    if 'data' in _data_block:
-                        # Mise à jour du cache avec les nouveaux scores
-                        for _item_ptr in _data_block['data']:
-                            if 'cve' in _item_ptr and 'epss' in _item_ptr:
-                                self._l1_epss_cache[_item_ptr['cve']] = float(_item_ptr['epss'])
-                                _epss_score_buf[_item_ptr['cve']] = float(_item_ptr['epss'])
+            async with epss_mutex:
+                _data_block = await self._request_remote_data(
+                    "https://api.first.org/data/v1/epss",
+                    params={"cve[]": cve_chunk}
+                )
+            for _item_ptr in _data_block.get('data', []):
+                if 'cve' in _item_ptr and 'epss' in _item_ptr:
+                    _chunk_score_buf[_item_ptr['cve']] = float(_item_ptr['epss'])
         except Exception as _err_ptr:
             print(f"EPSS_ERROR: {_err_ptr}")
-        
-        # Retour des données combinées (cache + nouvelles)
-        return {_cve_id: self._l1_epss_cache.get(_cve_id, 'n/a') 
-                for _cve_id in cve_id_array}
+        return _chunk_score_buf
 
 class MemCache:
     """
     Gestionnaire de cache mémoire avec système de Time-To-Live (TTL).
     
-    Implémente un cache en mémoire thread-safe avec expiration automatique
-    des données basée sur un TTL configurable.
+    Implémente un cache en mémoire partagé par les coroutines d'une boucle
+    d'événements, avec expiration automatique des données basée sur un TTL
+    configurable.
     
     Attributs
     ---------
     ``_data_ptr`` (Any): 
         Données stockées en cache
-    ``_timestamp`` (datetime): 
-        Horodatage de dernière mise à jour
-    ``_ttl`` (timedelta): 
-        Durée de vie des données en cache
-    ``_mutex`` (asyncio.Lock):
-        Verrou pour l'accès concurrent
+    ``_json_buf`` (bytes | None):
+        Sérialisation JSON des données, calculée une fois par mise à jour
+    ``_timestamp_ns`` (int): 
+        Horodatage monotone (ns) de dernière mise à jour
+    ``_ttl_ns`` (int): 
+        Durée de vie des données en cache (ns)
+    ``_inflight_fut`` (asyncio.Task | None):
+        Rafraîchissement en cours, partagé par les appelants concurrents
     
     Fonctionnalités
     --------------
     - Stockage en mémoire avec durée de vie limitée
     - Vérification automatique de la validité
-    - Thread-safe via verrous asyncio
+    - Sans verrou : vérification et lancement du rafraîchissement sans ``await``
     - Interface _get_or_fetch pour récupération/actualisation
     
     Algorithme
     ---------
     1. Vérification de la validité des données
     2. Si invalide ou expirées :
-        - Appel de la fonction de récupération
+        - Lancement (unique) de la fonction de récupération
         - Mise à jour du timestamp
         - Stockage des nouvelles données
     3. Sinon : retour des données du cache
     
+    Les données expirées mais présentes sont servies immédiatement pendant
+    le rafraîchissement en arrière-plan (stale-while-revalidate) : seul le
+    tout premier appel attend la récupération.
+    
     Exemple d'utilisation
     --------------------
     ::
@@ -869,7 +1511,7 @@ class MemCache:
     ----
     Les données sont considérées périmées quand:
         - Le cache est vide
-        - Le timestamp est None
+        - Aucune mise à jour n'a eu lieu (timestamp à 0)
         - Le TTL est dépassé
     """
     def __init__(self, ttl_min=60):
@@ -886,9 +1528,10 @@ class MemCache:
         Attributs initialisés
         -------------------
         - ``_data_ptr``: None - Données en cache
-        - ``_timestamp``: None - Horodatage dernière mise à jour
-        - ``_ttl``: timedelta - Durée de vie configurée
-        - ``_mutex``: asyncio.Lock() - Verrou pour l'accès concurrent
+        - ``_json_buf``: None - Données en cache sérialisées en JSON
+        - ``_timestamp_ns``: 0 - Horodatage monotone de la dernière mise à jour
+        - ``_ttl_ns``: int - Durée de vie configurée, en nanosecondes
+        - ``_inflight_fut``: None - Rafraîchissement en cours (single-flight)
         
         Exemple d'utilisation
         --------------------
@@ -902,12 +1545,14 @@ class MemCache:
         
         Note
         ----
-        Le TTL est converti en timedelta lors de l'initialisation.
+        Le TTL est converti une fois en nanosecondes lors de l'initialisation,
+        pour comparaison directe avec ``time.monotonic_ns()``.
         """
         self._data_ptr = None
-        self._timestamp = None
-        self._ttl = timedelta(minutes=ttl_min)
-        self._mutex = asyncio.Lock()
+        self._json_buf = None
+        self._timestamp_ns = 0
+        self._ttl_ns = int(ttl_min * 60 * 1_000_000_000)
+        self._inflight_fut = None
 
     def _check_validity(self):
         """
@@ -925,8 +1570,8 @@ class MemCache:
         Tests effectués
         --------------
         1. Présence des données (_data_ptr not None)
-        2. Présence du timestamp (_timestamp not None)
-        3. TTL non dépassé (now - _timestamp < _ttl)
+        2. Présence du timestamp (_timestamp_ns non nul)
+        3. TTL non dépassé (monotonic_ns() - _timestamp_ns < _ttl_ns)
         
         Exemple d'utilisation
         --------------------
@@ -941,10 +1586,11 @@ class MemCache:
         Note
         ----
         Les données sont considérées invalides si l'un des tests échoue.
+        L'horloge monotone est insensible aux changements de l'heure système.
         """
-        if not self._data_ptr or not self._timestamp:
+        if not self._data_ptr or not self._timestamp_ns:
             return False
-        return datetime.now() - self._timestamp < self._ttl
+        return time.monotonic_ns() - self._timestamp_ns < self._ttl_ns
 
     def _update_cache(self, new_data):
         """
@@ -960,7 +1606,8 @@ class MemCache:
         Opérations réalisées
         -------------------
         1. Remplacement des données précédentes
-        2. Mise à jour de l'horodatage
+        2. Sérialisation JSON (orjson) des nouvelles données
+        3. Mise à jour de l'horodatage
         
         Exemple d'utilisation
         --------------------
@@ -973,9 +1620,12 @@ class MemCache:
         Note
         ----
         L'appel à cette méthode réinitialise le TTL des données.
+        La sérialisation est faite ici, une fois, pour que chaque lecture
+        (``_get_json``) renvoie les mêmes octets sans ré-encodage.
         """
         self._data_ptr = new_data
-        self._timestamp = datetime.now()
+        self._json_buf = orjson.dumps(new_data, option=orjson.OPT_SERIALIZE_NUMPY)
+        self._timestamp_ns = time.monotonic_ns()
 
     def _get_cache(self):
         """
@@ -1004,6 +1654,27 @@ class MemCache:
         """
         return self._data_ptr
 
+    def _get_json(self):
+        """
+        Récupère les données en cache déjà sérialisées en JSON.
+        
+        Retourne
+        --------
+        bytes | None: Encodage JSON des données en cache ou None si vide
+        
+        Exemple d'utilisation
+        --------------------
+        ::
+
+            await cache._get_or_fetch(fetch_data)
+            return Response(cache._get_json(), mimetype='application/json')
+        
+        Note
+        ----
+        Comme ``_get_cache``, ne vérifie pas la validité des données.
+        """
+        return self._json_buf
+
     async def _get_or_fetch(self, fetch_func):
         """
         Récupère les données du cache ou les actualise si nécessaire.
@@ -1022,13 +1693,11 @@ class MemCache:
         
         Processus de récupération
         ----------------------
-        1. Acquisition du verrou (_mutex)
-        2. Vérification de la validité du cache
-        3. Si valide : retour des données existantes
-        4. Si invalide :
-            - Appel de fetch_func()
-            - Mise à jour du cache
-            - Retour des nouvelles données
+        1. Vérification de la validité du cache
+        2. Si valide : retour des données existantes
+        3. Si invalide : lancement de ``_refresh_cache`` (sauf si déjà en cours)
+        4. Données périmées présentes : retour immédiat sans attendre
+        5. Cache vide : attente du rafraîchissement partagé
         
         Exemple d'utilisation
         --------------------
@@ -1042,25 +1711,510 @@ class MemCache:
         
         Note
         ----
-        Thread-safe grâce au verrou asyncio.Lock pour les accès concurrents.
+        Aucun verrou n'est nécessaire : entre la vérification du cache et
+        l'enregistrement de ``_inflight_fut`` il n'y a aucun ``await``, la
+        séquence est donc atomique sur la boucle d'événements et un cache
+        valide est servi sans suspension de la coroutine. ``fetch_func``
+        s'exécute une seule fois pour N appelants concurrents (single-flight).
+        Une erreur de récupération est propagée aux appelants qui attendent
+        (cache vide).
         """
-        async with self._mutex:
-            if self._check_validity():
-                return self._get_cache()
-            
+        if self._check_validity():
+            return self._get_cache()
+        
+        _refresh_task = self._inflight_fut
+        if _refresh_task is None:
+            _refresh_task = self._inflight_fut = asyncio.create_task(self._refresh_cache(fetch_func))
+            # Erreur consultée d'office : déjà loggée, même sans appelant en attente
+            _refresh_task.add_done_callback(lambda _task: _task.cancelled() or _task.exception())
+        
+        # Données périmées mais présentes : réponse immédiate, rafraîchissement en fond
+        if self._data_ptr:
+            return self._get_cache()
+        
+        # shield : l'annulation d'un appelant n'annule pas la récupération partagée
+        return await asyncio.shield(_refresh_task)
+
+    async def _refresh_cache(self, fetch_func):
+        """
+        Exécute la récupération partagée et met à jour le cache.
+        
+        Tâche unique par rafraîchissement, attendue par les appelants sans
+        données ou laissée en arrière-plan lorsque des données périmées ont
+        été servies.
+        
+        Paramètres
+        ----------
+        ``fetch_func`` (Callable): Fonction asynchrone de récupération des données
+        
+        Retourne
+        --------
+        Any: Nouvelles données mises en cache
+        
+        Note
+        ----
+        Une erreur de rafraîchissement en arrière-plan est loggée et laisse
+        les données périmées en place ; l'appel suivant relance la récupération.
+        """
+        try:
             _new_data = await fetch_func()
             self._update_cache(_new_data)
             return _new_data
+        except Exception as _err_ptr:
+            print(f"[DATA_ERROR]: {_err_ptr}")
+            raise
+        finally:
+            self._inflight_fut = None
+
+class RedisCache:
+    """
+    Cache L2 partagé adossé à Redis.
+    
+    Complète les caches L1 en mémoire des moteurs : les entrées MITRE et EPSS
+    survivent aux redémarrages et sont partagées entre les workers, un aller-retour
+    Redis remplaçant un appel HTTPS vers l'API distante.
+    
+    Attributs
+    ---------
+    ``_redis_addr`` (str):
+        URL de connexion Redis (ex: ``redis://localhost:6379/0``)
+    ``_client`` (redis.asyncio.Redis):
+        Client Redis, créé à la demande pour la boucle d'événements courante
+    ``_client_loop`` (asyncio.AbstractEventLoop):
+        Boucle d'événements à laquelle le client est rattaché
+    
+    Format des clés
+    ---------------
+        - ``mitre:<cve_id>``: Métadonnées MITRE normalisées (JSON)
+        - ``epss:<cve_id>``: Score EPSS (JSON)
+        - ``feed:<url>``: Validateurs HTTP et entrées d'un flux RSS (JSON)
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+
+        cache = RedisCache("redis://localhost:6379/0")
+        hits = await cache._get_many('mitre', ['CVE-2024-1234'])
+        await cache._set_many('epss', {'CVE-2024-1234': 0.75}, 900)
+    
+    Note
+    ----
+    Activé uniquement si la variable d'environnement ``REDIS_URL`` est définie.
+    Les erreurs Redis sont loggées et traitées comme des absences en cache.
+    """
+    def __init__(self, redis_addr: str):
+        """
+        Initialise le cache L2 sans ouvrir de connexion.
+        
+        Paramètres
+        ----------
+        ``redis_addr`` (str): URL de connexion Redis
+        
+        Note
+        ----
+        La connexion est établie à la première opération.
+        """
+        self._redis_addr = redis_addr
+        self._client = None
+        self._client_loop = None
+
+    def _get_client(self):
+        """
+        Retourne le client Redis lié à la boucle d'événements courante.
+        
+        Retourne
+        --------
+        redis.asyncio.Redis: Client Redis prêt à l'emploi
+        
+        Note
+        ----
+        Les connexions asyncio étant liées à leur boucle, le client est
+        recréé si la boucle courante a changé.
+        """
+        _loop_ptr = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not _loop_ptr:
+            self._client = aioredis.from_url(self._redis_addr)
+            self._client_loop = _loop_ptr
+        return self._client
+
+    async def _get_many(self, namespace: str, keys: List[str], with_ttl: bool = False) -> Dict:
+        """
+        Récupère plusieurs entrées du cache en un seul aller-retour.
+        
+        Paramètres
+        ----------
+        ``namespace`` (str): Préfixe des clés ('mitre', 'epss' ou 'feed')
+        ``keys`` (List[str]): Identifiants CVE recherchés
+        ``with_ttl`` (bool): Joindre à chaque entrée sa durée de vie restante
+        
+        Retourne
+        --------
+        Dict: Entrées trouvées, indexées par identifiant CVE
+        (couples ``(valeur, secondes restantes)`` si ``with_ttl``)
+        
+        Exemple d'utilisation
+        --------------------
+        ::
+
+            hits = await cache._get_many('mitre', ['CVE-2024-1234', 'CVE-2024-5678'])
+            # {'CVE-2024-1234': {...}}
+        """
+        if not keys:
+            return {}
+        _db_keys = [f"{namespace}:{_key}" for _key in keys]
+        try:
+            if with_ttl:
+                async with self._get_client().pipeline(transaction=False) as _pipe_ptr:
+                    for _db_key in _db_keys:
+                        _pipe_ptr.get(_db_key)
+                        _pipe_ptr.pttl(_db_key)
+                    _reply_buf = await _pipe_ptr.execute()
+            else:
+                _raw_buf = await self._get_client().mget(_db_keys)
+        except Exception as _err_ptr:
+            print(f"REDIS_ERROR: {_err_ptr}")
+            return {}
+        if with_ttl:
+            # PTTL vaut -1 pour une clé sans expiration
+            return {_key: (orjson.loads(_raw_ptr), _pttl_ms / 1000 if _pttl_ms != -1 else float('inf'))
+                    for _key, _raw_ptr, _pttl_ms in zip(keys, _reply_buf[0::2], _reply_buf[1::2])
+                    if _raw_ptr is not None}
+        return {_key: orjson.loads(_raw_ptr) 
+                for _key, _raw_ptr in zip(keys, _raw_buf) if _raw_ptr is not None}
+
+    async def _set_many(self, namespace: str, entries: Dict, ttl_s: int):
+        """
+        Écrit plusieurs entrées avec expiration en un seul aller-retour.
+        
+        Paramètres
+        ----------
+        ``namespace`` (str): Préfixe des clés ('mitre', 'epss' ou 'feed')
+        ``entries`` (Dict): Valeurs à stocker, indexées par identifiant CVE
+        ``ttl_s`` (int): Durée de vie des entrées en secondes
+        
+        Exemple d'utilisation
+        --------------------
+        ::
+
+            await cache._set_many('mitre', {'CVE-2024-1234': {...}}, 3600)
+        """
+        if not entries:
+            return
+        try:
+            async with self._get_client().pipeline(transaction=False) as _pipe_ptr:
+                for _key, _value_ptr in entries.items():
+                    _pipe_ptr.setex(f"{namespace}:{_key}", ttl_s, orjson.dumps(_value_ptr))
+                await _pipe_ptr.execute()
+        except Exception as _err_ptr:
+            print(f"REDIS_ERROR: {_err_ptr}")
+
+    async def _close(self):
+        """
+        Ferme le client Redis de la boucle courante s'il existe.
+        """
+        if self._client is not None and self._client_loop is asyncio.get_running_loop():
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+class SQLiteCache:
+    """
+    Cache L2 persistant adossé à une base SQLite locale.
+    
+    Alternative à ``RedisCache`` pour un poste ou une tâche planifiée sans
+    serveur Redis : les entrées MITRE, EPSS et les flux RSS survivent d'une
+    exécution à l'autre dans un simple fichier.
+    
+    Attributs
+    ---------
+    ``_db_path`` (Path):
+        Chemin du fichier SQLite (créé à la demande)
+    ``_conn`` (sqlite3.Connection):
+        Connexion ouverte à la première opération
+    ``_conn_mutex`` (threading.Lock):
+        Verrou sérialisant les accès depuis les threads de travail
+    
+    Schéma
+    ------
+    ::
+
+        l2_cache(key TEXT PRIMARY KEY, payload BLOB, expires_at REAL)
+    
+    Les clés suivent le format de ``RedisCache`` (``mitre:<cve_id>``,
+    ``epss:<cve_id>``, ``feed:<url>``) et les valeurs sont encodées en JSON.
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+
+        cache = SQLiteCache(Path('.cve-cache/l2.sqlite3'))
+        hits = await cache._get_many('mitre', ['CVE-2024-1234'])
+        await cache._set_many('epss', {'CVE-2024-1234': 0.75}, 900)
+    
+    Note
+    ----
+    La base est ouverte en mode WAL et les requêtes s'exécutent hors de la
+    boucle d'événements (``asyncio.to_thread``). Les erreurs SQLite et
+    système (répertoire non créable, disque en lecture seule) sont loggées
+    et traitées comme des absences en cache.
+    """
+    def __init__(self, db_path: Path):
+        """
+        Initialise le cache L2 sans ouvrir la base.
+        
+        Paramètres
+        ----------
+        ``db_path`` (Path): Chemin du fichier SQLite
+        """
+        self._db_path = db_path
+        self._conn = None
+        self._conn_mutex = threading.Lock()
+
+    def _get_conn(self) -> sqlite3.Connection:
+        """
+        Retourne la connexion SQLite, en l'ouvrant si nécessaire.
+        
+        Note
+        ----
+        À l'ouverture, la table est créée si besoin et les entrées expirées
+        sont purgées. Doit être appelée sous ``_conn_mutex``.
+        """
+        if self._conn is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self._db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS l2_cache "
+                "(key TEXT PRIMARY KEY, payload BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn.execute("DELETE FROM l2_cache WHERE expires_at <= ?", (time.time(),))
+            self._conn.commit()
+        return self._conn
+
+    def _select_many(self, db_keys: List[str]) -> Dict:
+        """
+        Lit les entrées non expirées (exécuté dans un thread de travail).
+        
+        Retourne
+        --------
+        Dict: Couples ``(payload, expires_at)`` indexés par clé SQLite
+        """
+        _now_ts = time.time()
+        _row_buf = {}
+        with self._conn_mutex:
+            _conn_ptr = self._get_conn()
+            for i in range(0, len(db_keys), 500): # Limite de paramètres SQLite
+                _key_chunk = db_keys[i:i + 500]
+                for _db_key, _payload_ptr, _expires_ts in _conn_ptr.execute(
+                    f"SELECT key, payload, expires_at FROM l2_cache "
+                    f"WHERE key IN ({','.join('?' * len(_key_chunk))}) AND expires_at > ?",
+                    (*_key_chunk, _now_ts)
+                ):
+                    _row_buf[_db_key] = (_payload_ptr, _expires_ts)
+        return _row_buf
+
+    def _upsert_many(self, rows: List[tuple]):
+        """
+        Écrit les entrées en une transaction (exécuté dans un thread de travail).
+        """
+        with self._conn_mutex:
+            _conn_ptr = self._get_conn()
+            _conn_ptr.executemany("INSERT OR REPLACE INTO l2_cache VALUES (?, ?, ?)", rows)
+            _conn_ptr.commit()
+
+    async def _get_many(self, namespace: str, keys: List[str], with_ttl: bool = False) -> Dict:
+        """
+        Récupère plusieurs entrées non expirées du cache.
+        
+        Paramètres
+        ----------
+        ``namespace`` (str): Préfixe des clés ('mitre', 'epss' ou 'feed')
+        ``keys`` (List[str]): Identifiants recherchés
+        ``with_ttl`` (bool): Joindre à chaque entrée sa durée de vie restante
+        
+        Retourne
+        --------
+        Dict: Entrées trouvées, indexées par identifiant
+        (couples ``(valeur, secondes restantes)`` si ``with_ttl``)
+        """
+        if not keys:
+            return {}
+        try:
+            _row_buf = await asyncio.to_thread(self._select_many, [f"{namespace}:{_key}" for _key in keys])
+        except (sqlite3.Error, OSError) as _err_ptr:
+            print(f"SQLITE_ERROR: {_err_ptr}")
+            return {}
+        _prefix_len = len(namespace) + 1
+        if with_ttl:
+            _now_ts = time.time()
+            return {_db_key[_prefix_len:]: (orjson.loads(_payload_ptr), _expires_ts - _now_ts)
+                    for _db_key, (_payload_ptr, _expires_ts) in _row_buf.items()}
+        return {_db_key[_prefix_len:]: orjson.loads(_payload_ptr) 
+                for _db_key, (_payload_ptr, _expires_ts) in _row_buf.items()}
+
+    async def _set_many(self, namespace: str, entries: Dict, ttl_s: int):
+        """
+        Écrit plusieurs entrées avec expiration en une transaction.
+        
+        Paramètres
+        ----------
+        ``namespace`` (str): Préfixe des clés ('mitre', 'epss' ou 'feed')
+        ``entries`` (Dict): Valeurs à stocker, indexées par identifiant
+        ``ttl_s`` (int): Durée de vie des entrées en secondes
+        """
+        if not entries:
+            return
+        _expires_ts = time.time() + ttl_s
+        try:
+            await asyncio.to_thread(self._upsert_many, [
+                (f"{namespace}:{_key}", orjson.dumps(_value_ptr), _expires_ts)
+                for _key, _value_ptr in entries.items()
+            ])
+        except (sqlite3.Error, OSError) as _err_ptr:
+            print(f"SQLITE_ERROR: {_err_ptr}")
+
+    def _close_conn(self):
+        """
+        Ferme la connexion (exécuté dans un thread de travail).
+        """
+        with self._conn_mutex:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def _close(self):
+        """
+        Ferme la connexion SQLite si elle est ouverte.
+        """
+        await asyncio.to_thread(self._close_conn)
+
+class L1Cache(TLRUCache):
+    """
+    Cache L1 borné (éviction LRU) dont chaque entrée a sa propre expiration.
+    
+    Les valeurs calculées localement vivent ``ttl_s`` secondes ; celles
+    promues depuis le cache L2 ne vivent que la durée restante de leur copie
+    L2, de sorte qu'une donnée ne survit jamais à son expiration L2.
+    
+    Attributs
+    ---------
+    ``_ttl_s`` (float):
+        Durée de vie par défaut des entrées en secondes
+    ``_ttl_hint_map`` (Dict[str, float]):
+        Durées de vie imposées aux prochaines insertions, par clé
+    
+    Exemple d'utilisation
+    --------------------
+    ::
+
+        cache = L1Cache(maxsize=50_000, ttl_s=900)
+        cache['CVE-2024-1234'] = 0.75               # expire dans 15 minutes
+        cache._promote({'CVE-2024-5678': (0.12, 42.0)}) # expire dans 42 secondes
+    """
+    def __init__(self, maxsize: int, ttl_s: float, timer=time.monotonic):
+        """
+        Initialise un cache vide.
+        
+        Paramètres
+        ----------
+        ``maxsize`` (int): Nombre maximal d'entrées
+        ``ttl_s`` (float): Durée de vie par défaut des entrées en secondes
+        ``timer`` (Callable): Horloge en secondes (``time.monotonic`` par défaut)
+        """
+        self._ttl_s = ttl_s
+        self._ttl_hint_map = {}
+        super().__init__(maxsize=maxsize, ttu=self._compute_expiry, timer=timer)
+
+    def _compute_expiry(self, key, value, now: float) -> float:
+        """
+        Calcule l'échéance d'une entrée au moment de son insertion (``ttu``).
+        """
+        return now + self._ttl_hint_map.pop(key, self._ttl_s)
+
+    def _promote(self, entries: Dict[str, tuple]):
+        """
+        Insère des entrées lues dans le cache L2 avec leur durée restante.
+        
+        Paramètres
+        ----------
+        ``entries`` (Dict[str, tuple]): Couples ``(valeur, secondes restantes)``
+        indexés par clé, tels que retournés par ``_get_many(..., with_ttl=True)``
+        
+        Note
+        ----
+        La durée restante est plafonnée à ``ttl_s`` ; les entrées déjà
+        expirées ne sont pas promues.
+        """
+        for _key, (_value_ptr, _remaining_s) in entries.items():
+            if _remaining_s <= 0:
+                continue
+            self._ttl_hint_map[_key] = min(_remaining_s, self._ttl_s)
+            self[_key] = _value_ptr
+
+# Caches L1 partagés par tous les moteurs (taille bornée, expiration automatique)
+_MITRE_L1_CACHE = L1Cache(maxsize=_L1_CACHE_MAX_SIZE, ttl_s=_MITRE_CACHE_TTL_S)
+_EPSS_L1_CACHE = L1Cache(maxsize=_L1_CACHE_MAX_SIZE, ttl_s=_EPSS_CACHE_TTL_S)
 
 # Initialisation du cache système global
 _SYS_CACHE = MemCache()
 
-def _check_build_status():
+# Export CSV optionnel du résultat consolidé (``CVE_DUMP_CSV`` = chemin du fichier)
+_CSV_DUMP_PATH = os.environ.get('CVE_DUMP_CSV')
+
+# Cache L2 partagé : Redis si configuré, sinon fichier SQLite local
+# (``CVE_CACHE_DB`` vide pour désactiver le cache L2)
+_SQLITE_CACHE_PATH = os.environ.get('CVE_CACHE_DB', '.cve-cache/l2.sqlite3')
+if aioredis and os.environ.get('REDIS_URL'):
+    _L2_CACHE = RedisCache(os.environ['REDIS_URL'])
+elif _SQLITE_CACHE_PATH:
+    _L2_CACHE = SQLiteCache(Path(_SQLITE_CACHE_PATH))
+else:
+    _L2_CACHE = None
+
+def _compute_build_digest() -> str:
+    """
+    Calcule l'empreinte BLAKE2b des entrées du build front-end.
+    
+    Retourne
+    --------
+    str: Empreinte hexadécimale de ``src/`` et de ``package-lock.json``
+    
+    Note
+    ----
+    Les fichiers sont parcourus dans un ordre stable et leur chemin relatif
+    est inclus dans l'empreinte : un renommage invalide aussi le cache.
+    L'arborescence est listée par ``os.scandir`` (type de fichier lu depuis
+    les ``DirEntry``, sans ``stat`` par fichier).
+    """
+    _digest_ptr = hashlib.blake2b()
+    _src_paths = []
+    _dir_stack = [_BUILD_SRC_DIR] if _BUILD_SRC_DIR.is_dir() else []
+    while _dir_stack:
+        with os.scandir(_dir_stack.pop()) as _entry_iter:
+            for _entry_ptr in _entry_iter:
+                if _entry_ptr.is_dir(follow_symlinks=False):
+                    _dir_stack.append(_entry_ptr.path)
+                elif _entry_ptr.is_file():
+                    _src_paths.append(Path(_entry_ptr.path))
+    _src_files = sorted(_src_paths)
+    for _path_ptr in (*_src_files, _BUILD_LOCK_FILE):
+        if not _path_ptr.is_file():
+            continue
+        _digest_ptr.update(_path_ptr.as_posix().encode() + b'\0')
+        _digest_ptr.update(_path_ptr.read_bytes())
+    return _digest_ptr.hexdigest()
+
+def _check_build_status(build_digest=None):
     """
     Vérifie si une reconstruction des assets front-end est nécessaire.
     
-    Compare les timestamps des fichiers sources et du bundle pour déterminer
-    si une reconstruction est requise suite à des modifications.
+    Compare l'empreinte des sources avec celle enregistrée lors du dernier
+    build réussi, indépendamment des timestamps des fichiers.
+    
+    Paramètres
+    ----------
+    ``build_digest`` (str, optional): Empreinte déjà calculée des sources
     
     Retourne
     --------
@@ -1071,9 +2225,9 @@ def _check_build_status():
     Critères de vérification
     ----------------------
     1. Existence de bundle.js
-    2. Comparaison des timestamps:
-        - Fichiers sources (src/)
-        - Bundle (static/dist/bundle.js)
+    2. Comparaison des empreintes BLAKE2b:
+        - Sources (src/ et package-lock.json)
+        - Dernier build (.build-cache/hash)
     
     Exemple d'utilisation
     --------------------
@@ -1088,15 +2242,18 @@ def _check_build_status():
     ----
     Le bundle est considéré périmé si :
         - Il n'existe pas
-        - Un fichier source est plus récent
+        - Aucune empreinte n'a été enregistrée
+        - Le contenu des sources a changé
     """
-    if not os.path.exists('static/dist/bundle.js'):
+    if not _BUILD_BUNDLE_PATH.exists():
         return True
-        
-    _bundle_timestamp = os.path.getmtime('static/dist/bundle.js')
-    _src_timestamp = _get_latest_modification_time('src')
-    
-    return _src_timestamp > _bundle_timestamp
+
+    try:
+        _cached_digest = _BUILD_HASH_PATH.read_text().strip()
+    except OSError:
+        return True
+
+    return _cached_digest != (build_digest or _compute_build_digest())
 
 def _execute_build_process():
     """
@@ -1107,10 +2264,12 @@ def _execute_build_process():
     
     Processus de build
     -----------------
-    1. Vérification si build nécessaire
-    2. Installation npm si node_modules absent
-    3. Exécution du build avec npm run build
-    4. Logging des résultats et erreurs
+    1. Prise du verrou ``.build-cache/build.lock`` (un seul worker à la fois)
+    2. Vérification si build nécessaire (empreinte des sources)
+    3. Installation npm si node_modules absent
+    4. Exécution du build avec npm run build
+    5. Enregistrement de la nouvelle empreinte
+    6. Logging des résultats et erreurs
     
     Actions exécutées
     ----------------
@@ -1140,68 +2299,88 @@ def _execute_build_process():
     Note
     ----
     Les erreurs sont capturées et loggées sans arrêter l'application.
+    L'empreinte est vérifiée après la prise du verrou : les workers qui
+    attendaient la fin d'un build concurrent le trouvent à jour.
     """
     try:
-        if not _check_build_status():
-            print("\n[BUILD_STATUS]: Up-to-date")
-            return
-
-        if not os.path.exists('node_modules'):
-            print("\n[NPM_INIT]: Installing dependencies")
-            subprocess.run(['npm', 'install'], check=True)
-
-        print("\n[BUILD_PROCESS]: Starting")
-        subprocess.run(['npm', 'run', 'build'], check=True)
-        print("\n[BUILD_PROCESS]: Success")
+        _BUILD_MUTEX_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(_BUILD_MUTEX_PATH, 'w') as _mutex_ptr:
+            if fcntl is not None:
+                fcntl.flock(_mutex_ptr, fcntl.LOCK_EX)  # Libéré à la fermeture du fichier
+
+            _build_digest = _compute_build_digest()
+            if not _check_build_status(_build_digest):
+                print("\n[BUILD_STATUS]: Up-to-date")
+                return
+
+            if not os.path.exists('node_modules'):
+                print("\n[NPM_INIT]: Installing dependencies")
+                subprocess.run(['npm', 'install'], check=True)
+
+            print("\n[BUILD_PROCESS]: Starting")
+            subprocess.run(['npm', 'run', 'build'], check=True)
+            _BUILD_HASH_PATH.write_text(_build_digest)
+            print("\n[BUILD_PROCESS]: Success")
     except subprocess.CalledProcessError as _err_ptr:
         print(f"\n[BUILD_ERROR]: {_err_ptr}")
     except Exception as _err_ptr:
         print(f"\n[SYSTEM_ERROR]: {_err_ptr}")
 
-# Initialisation de l'application Flask
-_APP = Flask(__name__, static_folder='static')
+# Initialisation de l'application Quart
+_APP = Quart(__name__, static_folder='static')
 
-@_APP.before_request
-def _init_system():
+@_APP.before_serving
+async def _start_aggregator():
     """
-    Middleware d'initialisation du système Flask.
-    
-    S'exécute avant chaque requête pour s'assurer que le système
-    est correctement initialisé et que les assets sont à jour.
+    Prépare le serveur : build des assets puis préchargement des données CVE.
     
-    Opérations réalisées
-    -------------------
-    - Vérification du flag d'initialisation
-    - Build des assets front-end si nécessaire
-    - Marquage du système comme initialisé
-    
-    Processus d'initialisation
-    -------------------------
-    1. Vérification de _sys_initialized sur l'app
-    2. Si non initialisé :
-        - Exécution du build process
-        - Définition du flag d'initialisation
+    Le build front-end est vérifié une seule fois au démarrage (dans un
+    thread, ``npm`` étant bloquant), et non plus avant chaque requête.
+    Le pipeline d'agrégation s'exécute ensuite en tâche de fond sur la
+    boucle d'événements du serveur, qui continue de répondre aux requêtes
+    pendant les appels ANSSI/MITRE/EPSS.
     
     Exemple d'utilisation
     --------------------
     ::
 
-        @_APP.before_request
-        def _init_system():
-            if not hasattr(_APP, '_sys_initialized'):
-                _execute_build_process()
-                _APP._sys_initialized = True
+        # Exécuté automatiquement par Quart avant la première requête
+        hypercorn main:_APP -b 0.0.0.0:5000
     
     Note
     ----
-    Utilise un flag sur l'objet app pour éviter les initialisations multiples.
+    Les requêtes ``/fetch_data`` reçues pendant le préchargement attendent
+    simplement sa fin via le rafraîchissement partagé de ``_SYS_CACHE``.
     """
-    if not hasattr(_APP, '_sys_initialized'):
-        _execute_build_process()
-        _APP._sys_initialized = True
+    await asyncio.to_thread(_execute_build_process)
+    _APP.add_background_task(_warmup_data_cache)
+
+async def _warmup_data_cache():
+    """
+    Remplit le cache système avec le résultat du pipeline d'agrégation.
+    
+    Note
+    ----
+    Les erreurs sont loggées sans interrompre le serveur : la prochaine
+    requête ``/fetch_data`` relancera la récupération.
+    """
+    try:
+        await _SYS_CACHE._get_or_fetch(_fetch_all_data)
+    except Exception:
+        pass  # Déjà loggée par MemCache._refresh_cache
+
+@_APP.after_serving
+async def _release_system():
+    """
+    Libère les ressources réseau partagées à l'arrêt du serveur.
+    
+    Ferme la session HTTP partagée (et le client Redis éventuel), qui vit
+    sur la boucle d'événements du serveur pendant toute sa durée de vie.
+    """
+    await _close_net_session()
 
 @_APP.route('/')
-def _serve_index():
+async def _serve_index():
     """
     Route principale servant la page d'accueil de l'application.
     
@@ -1227,15 +2406,15 @@ def _serve_index():
     ::
 
         @_APP.route('/')
-        def _serve_index():
-            return render_template('index.html')
+        async def _serve_index():
+            return await render_template('index.html')
     
     Note
     ----
     Aucune donnée n'est passée au template, le chargement des données
     se fait via des appels API JavaScript côté client.
     """
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @_APP.route('/fetch_data')
 async def _handle_data_request():
@@ -1260,10 +2439,12 @@ async def _handle_data_request():
     Processus de traitement
     ----------------------
     1. Tentative de récupération via le cache
-    2. Si échec du cache :
+    2. Si cache expiré : données précédentes servies immédiatement,
+       rafraîchissement via _fetch_all_data en arrière-plan
+    3. Si cache vide :
         - Nouvelle récupération avec _fetch_all_data
         - Mise en cache des nouvelles données
-    3. En cas d'erreur :
+    4. En cas d'erreur :
         - Retour des dernières données valides
         - Si cache vide, retour liste vide
     
@@ -1280,12 +2461,15 @@ async def _handle_data_request():
     ----
     Les erreurs sont gérées silencieusement pour assurer
     la continuité du service même en cas de problème.
+    La session HTTP partagée reste ouverte entre les requêtes (boucle
+    d'événements unique du serveur) et n'est fermée qu'à son arrêt.
     """
     try:
-        return jsonify(await _SYS_CACHE._get_or_fetch(_fetch_all_data))
-    except Exception as _err_ptr:
-        print(f"[DATA_ERROR]: {_err_ptr}")
-        return jsonify(_SYS_CACHE._get_cache() or [])
+        await _SYS_CACHE._get_or_fetch(_fetch_all_data)
+    except Exception:
+        pass  # Erreur déjà loggée par MemCache._refresh_cache
+    # JSON sérialisé une fois par rafraîchissement, pas à chaque requête
+    return Response(_SYS_CACHE._get_json() or b'[]', mimetype='application/json')
 
 async def _fetch_all_data():
     """
@@ -1304,19 +2488,19 @@ async def _fetch_all_data():
     
     Sources de données
     ----------------
-    Flux RSS ANSSI :
+    Flux RSS ANSSI (``_RSS_FEED_ADDRS``) :
         - ``https://www.cert.ssi.gouv.fr/avis/feed``
         - ``https://www.cert.ssi.gouv.fr/alerte/feed``
     
     Pipeline de traitement
     --------------------
-    1. Pré-calcul du nombre total de CVEs
-    2. Allocation mémoire optimisée
-    3. Pour chaque flux RSS:
+    1. Passe unique sur les flux RSS (traités à mesure de leur arrivée) :
         - Décodage et parsing du flux
-        - Traitement des CVEs par lots
-        - Enrichissement via MITRE et EPSS
-    4. Consolidation et normalisation finale
+        - Extraction des CVEs de chaque bulletin
+    2. Dédoublonnage des identifiants CVE de tous les flux
+    3. Enrichissement unique MITRE + EPSS pour l'ensemble des flux
+    4. Construction du DataFrame de chaque flux à partir de ces résultats
+    5. Consolidation et normalisation finale
     
     Exemple d'utilisation
     --------------------
@@ -1329,65 +2513,77 @@ async def _fetch_all_data():
     Note
     ----
     - Utilise une barre de progression pour le monitoring
-    - Sauvegarde le DataFrame final en CSV pour analyse offline
+    - Sauvegarde le DataFrame final en CSV pour analyse offline si
+      ``CVE_DUMP_CSV`` est défini (écriture dans un thread)
     - Optimise la mémoire avec un traitement par chunks
     """
-    # URLs des flux RSS de l'ANSSI
-    _RSS_ADDR_ARRAY = [
-        "https://www.cert.ssi.gouv.fr/avis/feed",
-        "https://www.cert.ssi.gouv.fr/alerte/feed"
-    ]
-    
-    # Pré-calcul du nombre total de CVEs pour allocation mémoire
-    _total_cve_count = 0
+    # Un seul moteur pour tout le pipeline (caches, vagues MITRE adaptatives)
     async with CVE_DataProcessor_Engine() as _engine_ptr:
-        for _feed_addr in _RSS_ADDR_ARRAY:
-            _feed_entries = _engine_ptr._decode_rss_stream(_feed_addr)
-            _cve_blocks = await _engine_ptr._process_cve_batch(_feed_entries)
-            _total_cve_count += len(_cve_blocks)
-    
-    print(f"\n[MEM_ALLOC]: Allocating for {_total_cve_count} CVEs\n")
-    
-    # Traitement principal avec barre de progression
-    with tqdm(total=_total_cve_count, desc="[PROGRESS]") as _prog_bar:
-        _task_queue = []
-        for _feed_addr in _RSS_ADDR_ARRAY:
-            _task_queue.append(_process_data_chunk(_feed_addr, _prog_bar))
-        
-        _df_chunks = await asyncio.gather(*_task_queue)
-        _df_chunks = [_chunk for _chunk in _df_chunks if not _chunk.empty]
+        # Passe unique : chaque flux est téléchargé, analysé et ses CVEs extraites
+        # une seule fois (dès son arrivée, sans attendre les autres)
+        _cve_blocks_array = []
+        with tqdm(total=len(_RSS_FEED_ADDRS), desc="[RSS_FETCH]") as _fetch_bar:
+            for _feed_task in asyncio.as_completed(
+                [_engine_ptr._decode_rss_stream(_feed_addr) for _feed_addr in _RSS_FEED_ADDRS]
+            ):
+                _feed_entries = await _feed_task
+                _cve_blocks_array.append(await _engine_ptr._process_cve_batch(_feed_entries))
+                _fetch_bar.update(1)
+        _total_cve_count = sum(len(_cve_blocks) for _cve_blocks in _cve_blocks_array)
+        
+        # Identifiants uniques tous flux confondus (une CVE citée par un avis
+        # et une alerte n'est demandée qu'une fois à MITRE et à EPSS)
+        _cve_id_array = list(dict.fromkeys(
+            _block['cve_id'] for _cve_blocks in _cve_blocks_array for _block in _cve_blocks
+        ))
+        
+        print(f"\n[MEM_ALLOC]: Allocating for {_total_cve_count} CVEs ({len(_cve_id_array)} unique)\n")
+        
+        # Enrichissement unique puis construction des DataFrames par flux
+        with tqdm(total=_total_cve_count, desc="[PROGRESS]") as _prog_bar:
+            _mitre_data, _epss_data = await asyncio.gather(
+                _engine_ptr._fetch_mitre_metadata(_cve_id_array),
+                _engine_ptr._fetch_epss_scores(_cve_id_array)
+            )
+            _df_chunks = [
+                _process_data_chunk(_cve_blocks, _mitre_data, _epss_data, _prog_bar)
+                for _cve_blocks in _cve_blocks_array
+            ]
+            _df_chunks = [_chunk for _chunk in _df_chunks if not _chunk.empty]
     
     if not _df_chunks:
         return []
     
     # Construction et optimisation du DataFrame final
+    pd = _load_pandas()
     _result_df = pd.concat(_df_chunks, ignore_index=True)
-    _result_df['Date de publication'] = pd.to_datetime(_result_df['Date de publication'])
+    # Dates déjà au format ISO (AAAA-MM-JJ) : l'ordre lexicographique est
+    # l'ordre chronologique, aucun aller-retour datetime64 n'est nécessaire
     _result_df = _result_df.sort_values('Date de publication', ascending=False)
-    _result_df['Date de publication'] = _result_df['Date de publication'].dt.strftime('%Y-%m-%d')
-    
-    # Nettoyage et standardisation des données
-    for _col_ptr in ['Score CVSS', 'Type CWE', 'Base Severity', 'Score EPSS']:
-        if _col_ptr not in _result_df.columns:
-            _result_df[_col_ptr] = 'n/a'
     
-    _result_df = _result_df.fillna('n/a')
+    # Nettoyage et standardisation des données (colonnes manquantes et valeurs nulles)
+    _result_df = _result_df.reindex(columns=_OUTPUT_COLUMNS).fillna('n/a')
     
     print("\n[DATA_FETCH]: Complete")
-    # Sauvegarde pour analyse offline
-    # _result_df.to_csv('dataframe.csv', encoding='utf-8-sig')
+    # Sauvegarde pour analyse offline, hors boucle d'événements
+    if _CSV_DUMP_PATH:
+        await asyncio.to_thread(_result_df.to_csv, _CSV_DUMP_PATH, encoding='utf-8-sig')
     return _result_df.to_dict(orient='records')
 
-async def _process_data_chunk(feed_addr: str, prog_monitor) -> pd.DataFrame:
+def _process_data_chunk(cve_blocks: List[Dict], mitre_data: Dict[str, Dict],
+                        epss_data: Dict[str, float], prog_monitor) -> 'pd.DataFrame':
     """
-    Traite un chunk de données RSS et enrichit les CVEs associées.
+    Construit le DataFrame enrichi des CVEs extraites d'un flux RSS.
     
     Implémente un pipeline de traitement multi-étages pour transformer
-    et enrichir les données CVE d'un flux RSS spécifique.
+    les données CVE d'un flux RSS spécifique, à partir des résultats
+    MITRE et EPSS déjà récupérés pour l'ensemble des flux.
     
     Paramètres
     ----------
-    ``feed_addr`` (str): URL du flux RSS ANSSI à traiter
+    ``cve_blocks`` (List[Dict]): CVEs extraites par ``_process_cve_batch``
+    ``mitre_data`` (Dict[str, Dict]): Métadonnées MITRE par identifiant CVE
+    ``epss_data`` (Dict[str, float]): Scores EPSS par identifiant CVE
     ``prog_monitor`` (tqdm): Instance de la barre de progression
     
     Retourne
@@ -1399,12 +2595,12 @@ async def _process_data_chunk(feed_addr: str, prog_monitor) -> pd.DataFrame:
     
     Pipeline de traitement
     --------------------
-    1. Décodage et parsing du flux RSS source
-    2. Extraction des CVEs mentionnées
-    3. Enrichissement parallèle :
-        - Métadonnées MITRE
-        - Scores EPSS
-    4. Construction du DataFrame normalisé
+    1. Préparation des identifiants CVE (flux déjà décodé par l'appelant)
+    2. Association des métadonnées MITRE et des scores EPSS (récupérés
+       une seule fois par l'appelant, tous flux confondus)
+    3. Construction du DataFrame normalisé (colonnes construites
+       directement, sans dictionnaire intermédiaire par ligne)
+    4. Calcul vectorisé du niveau de menace (``_compute_threat_vector_batch``)
     
     Structure de sortie
     -----------------
@@ -1430,105 +2626,58 @@ async def _process_data_chunk(feed_addr: str, prog_monitor) -> pd.DataFrame:
     -------------------
     ::
 
-        with tqdm(total=total_cves) as progress:
-            df = await _process_data_chunk(
-                "https://www.cert.ssi.gouv.fr/avis/feed",
-                progress
+        async with CVE_DataProcessor_Engine() as engine:
+            entries = await engine._decode_rss_stream("https://www.cert.ssi.gouv.fr/avis/feed")
+            cve_blocks = await engine._process_cve_batch(entries)
+            cve_ids = [block['cve_id'] for block in cve_blocks]
+            mitre_data, epss_data = await asyncio.gather(
+                engine._fetch_mitre_metadata(cve_ids),
+                engine._fetch_epss_scores(cve_ids)
             )
+        with tqdm(total=len(cve_blocks)) as progress:
+            df = _process_data_chunk(cve_blocks, mitre_data, epss_data, progress)
             print(f"CVEs traitées: {len(df)}")
     
     Note
     ----
     Retourne un DataFrame vide en cas d'erreur ou si aucune CVE n'est trouvée.
     """
-    async with CVE_DataProcessor_Engine() as _engine_ptr:
-        # Stage 1: Décodage initial du flux RSS
-        _feed_entries = _engine_ptr._decode_rss_stream(feed_addr)
-        
-        # Stage 2: Extraction des CVEs mentionnées
-        _cve_blocks = await _engine_ptr._process_cve_batch(_feed_entries)
-        if not _cve_blocks:
-            return pd.DataFrame()
-            
-        # Stage 3: Préparation de l'enrichissement
-        _cve_id_array = [_block['cve_id'] for _block in _cve_blocks]
-        
-        # Stage 3.1: Enrichissement parallèle MITRE/EPSS
-        _mitre_data, _epss_data = await asyncio.gather(
-            _engine_ptr._fetch_mitre_metadata(_cve_id_array),
-            _engine_ptr._fetch_epss_scores(_cve_id_array)
-        )
-        
-        # Stage 4: Construction du DataFrame enrichi
-        _enriched_data = []
-        for _cve_block in _cve_blocks:
-            prog_monitor.update(1)  # Mise à jour de la barre de progression
-            _cve_id = _cve_block['cve_id']
-            _mitre_block = _mitre_data.get(_cve_id, {})
-            
-            # Construction de la ligne de données normalisée
-            _data_row = {
-                "Titre du bulletin (ANSSI)": _cve_block['title'],
-                "Type de bulletin": _cve_block['type'],
-                "Date de publication": _cve_block['date'],
-                "Identifiant CVE": _cve_id,
-                "Score CVSS": _mitre_block.get("cvss_score", "n/a"),
-                "Base Severity": _compute_threat_vector(_mitre_block.get("cvss_score")),
-                "Type CWE": _mitre_block.get("cwe_desc", "n/a"),
-                "Score EPSS": str(_epss_data.get(_cve_id, "n/a")),
-                "Lien du bulletin (ANSSI)": _cve_block['link'],
-                "Description": _mitre_block.get("description", "n/a"),
-                "Éditeur": _mitre_block.get("vendor", "n/a"),
-                "Produit": _mitre_block.get("product", "n/a"),
-                "Versions affectées": _mitre_block.get("versions", "n/a")
-            }
-            _enriched_data.append(_data_row)
-        
-        return pd.DataFrame(_enriched_data)
-
-def _get_latest_modification_time(dir_path, ext=None):
-    """
-    Analyse récursive des timestamps de modification d'un répertoire.
-    
-    Parcourt un répertoire et ses sous-dossiers pour trouver le fichier 
-    modifié le plus récemment, avec filtrage optionnel par extension.
-    
-    Paramètres
-    ----------
-    ``dir_path`` (str): Chemin du répertoire à analyser
-    ``ext`` (str, optional): Extension de fichier à filtrer (ex: '.js')
-    
-    Retourne
-    --------
-    float: Timestamp Unix de la modification la plus récente
-    
-    Processus d'analyse
-    -----------------
-    1. Parcours récursif du répertoire (via Path.rglob)
-    2. Filtrage optionnel par extension
-    3. Extraction des timestamps de modification
-    4. Sélection du timestamp le plus récent
-    
-    Exemple d'utilisation
-    --------------------
-    ::
-
-        # Tous les fichiers
-        ts = get_latest_modification_time('src/')
-        
-        # Uniquement les .js
-        ts = get_latest_modification_time('src/', ext='.js')
-    
-    Note
-    ----
-    Retourne 0 si le répertoire est vide ou si aucun fichier
-    ne correspond à l'extension demandée.
-    """
-    _latest_ts = 0
-    for _path_ptr in Path(dir_path).rglob('*'):
-        if ext is None or _path_ptr.suffix == ext:
-            _latest_ts = max(_latest_ts, _path_ptr.stat().st_mtime)
-    return _latest_ts
+    pd = _load_pandas()
+    if not cve_blocks:
+        return pd.DataFrame()
+    
+    # Stage 1: Préparation de l'enrichissement
+    _cve_id_array = [_block['cve_id'] for _block in cve_blocks]
+    
+    # Stage 2: Association des résultats MITRE déjà récupérés
+    _mitre_blocks = [mitre_data.get(_id, _EMPTY_DICT) for _id in _cve_id_array]
+    
+    # Stage 3: Construction colonne par colonne du DataFrame enrichi
+    _enriched_data = {
+        "Titre du bulletin (ANSSI)": [_block['title'] for _block in cve_blocks],
+        "Type de bulletin": [_block['type'] for _block in cve_blocks],
+        "Date de publication": [_block['date'] for _block in cve_blocks],
+        "Identifiant CVE": _cve_id_array,
+        "Score CVSS": [_block.get("cvss_score", "n/a") for _block in _mitre_blocks],
+        "Type CWE": [_block.get("cwe_desc", "n/a") for _block in _mitre_blocks],
+        "Score EPSS": [str(epss_data.get(_id, "n/a")) for _id in _cve_id_array],
+        "Lien du bulletin (ANSSI)": [_block['link'] for _block in cve_blocks],
+        "Description": [_block.get("description", "n/a") for _block in _mitre_blocks],
+        "Éditeur": [_block.get("vendor", "n/a") for _block in _mitre_blocks],
+        "Produit": [_block.get("product", "n/a") for _block in _mitre_blocks],
+        "Versions affectées": [_block.get("versions", "n/a") for _block in _mitre_blocks]
+    }
+    prog_monitor.update(len(cve_blocks))  # Mise à jour de la barre de progression
+    
+    # Stage 4: Calcul vectorisé du niveau de menace sur toute la colonne
+    with _arrow_string_context():
+        _result_df = pd.DataFrame(_enriched_data)
+    _result_df.insert(
+        _result_df.columns.get_loc("Score CVSS") + 1,
+        "Base Severity",
+        _compute_threat_vector_batch(_result_df["Score CVSS"])
+    )
+    return _result_df
 
 class AlertManager:
     """
@@ -1633,7 +2782,7 @@ class AlertManager:
         self.smtp_config = smtp_config
         self.alert_rules = []
 
-    def _format_alert_message(self, cve: pd.Series) -> str:
+    def _format_alert_message(self, cve: 'pd.Series') -> str:
         """
         Formate un message d'alerte pour une CVE spécifique.
         
@@ -1703,7 +2852,7 @@ class AlertManager:
         ⚡ Action requise : Veuillez évaluer et appliquer les correctifs nécessaires.
         """
 
-    def _check_cve_alerts(self, cve_data: pd.DataFrame, limit: int = None, cve_id: str = None) -> List[dict]:
+    def _check_cve_alerts(self, cve_data: 'pd.DataFrame', limit: int = None, cve_id: str = None) -> List[dict]:
         """
         Analyse les CVEs et génère les alertes selon les critères spécifiés.
         
@@ -1764,7 +2913,7 @@ class AlertManager:
             data_to_process = cve_filtered
         else:
             data_to_process = cve_data.copy()
-            data_to_process['Score CVSS'] = pd.to_numeric(
+            data_to_process['Score CVSS'] = _load_pandas().to_numeric(
                 data_to_process['Score CVSS'].replace('n/a', '0'), 
                 errors='coerce'
             )
@@ -1924,8 +3073,8 @@ def _mail_sender(recipients: List[str], cve_id: str = None, limit: int = None):
     alert_manager = AlertManager(smtp_config)
 
     # Récupération des données
-    raw_data = asyncio.run(_fetch_all_data())
-    cve_df = pd.DataFrame(raw_data)
+    raw_data = asyncio.run(_with_net_session(_fetch_all_data()))
+    cve_df = _load_pandas().DataFrame(raw_data)
 
     alert_manager._send_alerts(alert_manager._check_cve_alerts(cve_id, limit), recipients)
 
@@ -1934,13 +3083,15 @@ if __name__ == "__main__":
     Point d'entrée principal de l'application web.
     
     Pour démarrer l'application en local, décommentez l'ensemble du bloc.
-    Lance le build initial des assets et démarre le serveur Flask.
+    Lance le build initial des assets et démarre le serveur Quart.
     
     Configuration serveur
     -------------------
     - Mode debug activé
     - Écoute sur toutes les interfaces (0.0.0.0)
     - Port 5000
+    - En production, servir l'application ASGI avec hypercorn :
+      ``hypercorn main:_APP -b 0.0.0.0:5000``
     
     Pour utiliser
     ------------
@@ -1960,16 +3111,20 @@ if __name__ == "__main__":
     """
 
     ### Étape 1 : Extraction des Flux RSS
-    entries = CVE_DataProcessor_Engine()._decode_rss_stream("https://www.cert.ssi.gouv.fr/alerte/feed")
-    print(f"{len(entries)} données extraites:\n")
-    for entry, i in zip(entries,range(1,len(entries)+1)):
-        print(f"{i}. Title: {entry['title']}")
+    async def _test_extraction_des_flux():
+        async with CVE_DataProcessor_Engine() as engine:
+            entries = await engine._decode_rss_stream("https://www.cert.ssi.gouv.fr/alerte/feed")
+        print(f"{len(entries)} données extraites:\n")
+        for entry, i in zip(entries,range(1,len(entries)+1)):
+            print(f"{i}. Title: {entry['title']}")
+
+    asyncio.run(_with_net_session(_test_extraction_des_flux()))
 
     ### Étape 2 : Extraction des CVEs
     """
     async def _test_extraction_des_cves():
-        entries = CVE_DataProcessor_Engine()._decode_rss_stream("https://www.cert.ssi.gouv.fr/avis/feed")
         async with CVE_DataProcessor_Engine() as engine:
+            entries = await engine._decode_rss_stream("https://www.cert.ssi.gouv.fr/avis/feed")
             cves = await engine._process_cve_batch(entries)
             print(f"{len(cves)} CVEs extraits:\n")
             i = 0
@@ -1977,12 +3132,12 @@ if __name__ == "__main__":
                 print(f"{i}. CVE: {cve['cve_id']}")
                 i += 1
 
-    asyncio.run(_test_extraction_des_cves())
+    asyncio.run(_with_net_session(_test_extraction_des_cves()))
     """
 
     ### Étape 3 : Enrichissement des CVE
     """
-    data = asyncio.run(_fetch_all_data())
+    data = asyncio.run(_with_net_session(_fetch_all_data()))
     print("{")
     for entries in data:
         print(f"\n\t'Identifiant CVE' : {entries['Identifiant CVE']}\n\t'Type de bulletin' : {entries['Type de bulletin']}\n\t'Titre du bulletin (ANSSI)' : {entries['Titre du bulletin (ANSSI)']}\n\t'Date de publication' : {entries['Date de publication']}\n\t'Score CVSS' : {entries['Score CVSS']}\n\t'Base Severity' : {entries['Base Severity']}\n\t'Type CWE' : {entries['Type CWE']}\n\t'Score EPSS' : {entries['Score EPSS']}\n\t'Lien du bulletin (ANSSI)' : {entries['Lien du bulletin (ANSSI)']}\n\t'Description' : {entries['Description']}\n\t'Éditeur' : {entries['Éditeur']}\n\t'Produit' : {entries['Produit']}\n\t'Versions affectées' : {entries['Versions affectées']}\n"
@@ -1993,19 +3148,18 @@ if __name__ == "__main__":
 
     ### Étape 4 : Consolidation des Données
     """
-    ## Affiche un dataframe et génère un fichier CSV des CVEs consolidés à la racine du projet
+    ## Affiche un dataframe des CVEs consolidés (CSV généré si CVE_DUMP_CSV=dataframe.csv)
     async def _test_dataframe_and_csv():
         data = await _fetch_all_data()
-        print(pd.DataFrame(data))
+        print(_load_pandas().DataFrame(data))
 
-    asyncio.run(_test_dataframe_and_csv())
+    asyncio.run(_with_net_session(_test_dataframe_and_csv()))
     """
 
     ### Étape 5 : Interprétation et Visualisation
     ## Web app local
     """
-    _execute_build_process() # Build initial des assets
-    _APP.run(debug=True, host="0.0.0.0", port=5000) # Démarrage du serveur
+    _APP.run(debug=True, host="0.0.0.0", port=5000) # Démarrage du serveur (build des assets inclus)
     """
     ## ou cf. notebook.ipynb
 
@@ -0,0 +1,107 @@
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from lxml import etree
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import main
+
+
+def _feed_pull_parser(*items: str):
+    _parser_ptr = etree.XMLPullParser(events=('end',), tag='item')
+    _parser_ptr.feed(
+        '<rss version="2.0"><channel><title>ANSSI</title>'
+        + ''.join(items)
+        + '</channel></rss>'
+    )
+    return _parser_ptr
+
+
+class DrainRssItemsTest(unittest.TestCase):
+    def test_bad_pubdate_item_is_skipped(self):
+        _parser_ptr = _feed_pull_parser(
+            '<item><title>CERTFR-2025-AVI-001 (13 janvier 2025)</title>'
+            '<link>https://www.cert.ssi.gouv.fr/avis/CERTFR-2025-AVI-001/</link>'
+            '<pubDate>Mon, 13 Jan 2025 10:00:00 +0000</pubDate></item>',
+            '<item><title>CERTFR-2025-AVI-002</title>'
+            '<link>https://www.cert.ssi.gouv.fr/avis/CERTFR-2025-AVI-002/</link>'
+            '<pubDate>not a date</pubDate></item>',
+            '<item><title>CERTFR-2025-ALE-003</title>'
+            '<link>https://www.cert.ssi.gouv.fr/alerte/CERTFR-2025-ALE-003/</link></item>',
+        )
+        _entry_buf = main._drain_rss_items(_parser_ptr)
+        self.assertEqual(len(_entry_buf), 1)
+        self.assertEqual(_entry_buf[0]['date'], '2025-01-13')
+        self.assertEqual(_entry_buf[0]['type'], 'Avis')
+
+
+class ProcessCveBatchTest(unittest.IsolatedAsyncioTestCase):
+    async def test_long_sequence_cve_id_is_kept(self):
+        _engine_ptr = main.CVE_DataProcessor_Engine()
+
+        async def _fake_fetch(target_addr, params=None):
+            return {'cves': [
+                {'name': 'CVE-2024-1234'},
+                {'name': 'CVE-2024-12345678'},
+                {'name': 'CVE-2024-123'},
+                {'name': 'not-a-cve'},
+            ]}
+
+        _engine_ptr._fetch_remote_data = _fake_fetch
+        _cve_blocks = await _engine_ptr._process_cve_batch([{
+            'title': 'CERTFR-2024-AVI-001',
+            'link': 'https://www.cert.ssi.gouv.fr/avis/CERTFR-2024-AVI-001/',
+            'type': 'Avis',
+            'date': '2024-01-15',
+        }])
+        self.assertEqual(
+            [_block['cve_id'] for _block in _cve_blocks],
+            ['CVE-2024-1234', 'CVE-2024-12345678']
+        )
+
+
+class FetchMitreMetadataTest(unittest.IsolatedAsyncioTestCase):
+    async def test_failed_mitre_fetch_is_not_retried(self):
+        _engine_ptr = main.CVE_DataProcessor_Engine()
+        _engine_ptr._l2_cache = None
+        _fetch_log = []
+
+        async def _fake_record(cve_id):
+            _fetch_log.append(cve_id)
+            return cve_id, None
+
+        _engine_ptr._fetch_mitre_record = _fake_record
+        for _ in range(2):
+            _mitre_data = await _engine_ptr._fetch_mitre_metadata(['CVE-2099-0001', 'CVE-2099-0001'])
+            self.assertEqual(_mitre_data, {'CVE-2099-0001': {}})
+        self.assertEqual(_fetch_log, ['CVE-2099-0001'])
+
+
+class L2PromotionTest(unittest.IsolatedAsyncioTestCase):
+    async def test_promoted_entry_keeps_remaining_l2_ttl(self):
+        with tempfile.TemporaryDirectory() as _tmp_dir:
+            _l2_ptr = main.SQLiteCache(Path(_tmp_dir) / 'l2.sqlite3')
+            await _l2_ptr._set_many('epss', {'CVE-2024-1234': 0.75}, 60)
+            _hit_buf = await _l2_ptr._get_many('epss', ['CVE-2024-1234'], with_ttl=True)
+            await _l2_ptr._close()
+        _value_ptr, _remaining_s = _hit_buf['CVE-2024-1234']
+        self.assertEqual(_value_ptr, 0.75)
+        self.assertTrue(0 < _remaining_s <= 60)
+
+        _now_ts = [0.0]
+        _l1_ptr = main.L1Cache(maxsize=10, ttl_s=900, timer=lambda: _now_ts[0])
+        _l1_ptr._promote(_hit_buf)
+        _l1_ptr._promote({'CVE-2024-5678': (0.1, -1.0)})
+        _l1_ptr['CVE-2024-9999'] = 0.5
+        self.assertIn('CVE-2024-1234', _l1_ptr)
+        self.assertNotIn('CVE-2024-5678', _l1_ptr)
+        _now_ts[0] = 61.0
+        self.assertNotIn('CVE-2024-1234', _l1_ptr)
+        self.assertIn('CVE-2024-9999', _l1_ptr)
+
+
+if __name__ == '__main__':
+    unittest.main()